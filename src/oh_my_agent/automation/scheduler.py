@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone, tzinfo
 from pathlib import Path
@@ -664,14 +665,24 @@ class Scheduler:
     def _scan_snapshot(self) -> dict[Path, tuple[int, int]]:
         snapshot: dict[Path, tuple[int, int]] = {}
         self._storage_dir.mkdir(parents=True, exist_ok=True)
-        for path in sorted(
-            [*self._storage_dir.glob("*.yaml"), *self._storage_dir.glob("*.yml")],
-            key=lambda item: str(item),
-        ):
-            if not path.is_file():
+        # Polled by the reload loop, so use one scandir pass: ``DirEntry``
+        # answers ``is_file`` from the dirent type and caches ``stat``,
+        # instead of two globs plus per-path is_file/stat/resolve syscalls.
+        with os.scandir(self._storage_dir) as it:
+            entries = sorted(
+                (entry for entry in it if entry.name.endswith((".yaml", ".yml"))),
+                key=lambda entry: entry.name,
+            )
+        for entry in entries:
+            if not entry.is_file():
                 continue
-            stat = path.stat()
-            snapshot[path.resolve()] = (stat.st_mtime_ns, stat.st_size)
+            stat = entry.stat()
+            path = Path(entry.path)
+            # ``_storage_dir`` is already resolved; only symlinked files need
+            # resolving to keep snapshot keys canonical.
+            if entry.is_symlink():
+                path = path.resolve()
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
         return snapshot
 
     def _parse_automation_file(self, path: Path) -> _ParsedAutomation | None:
@@ -2356,7 +2356,7 @@ class GatewayManager:
 
     @staticmethod
     def _thread_name(content: str) -> str:
-        name = content[:THREAD_NAME_MAX].split("\n")[0]
+        name = content[:THREAD_NAME_MAX].partition("\n")[0]
         if len(content) > THREAD_NAME_MAX:
             name += "..."
         return name
@@ -4,6 +4,7 @@ import logging
 import re
 import tempfile
 import threading
+import time
 import uuid
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -55,6 +56,11 @@ THREAD_ARCHIVE_MINUTES: Literal[60, 1440, 4320, 10080] = 60
 STATUS_MESSAGE_PREFIX = "**Task Status**"
 _MAX_IMAGE_BYTES = 10 * 1024 * 1024  # 10 MB
 _ATTACHMENT_DIR = Path(tempfile.gettempdir()) / "oh-my-agent" / "attachments"
+# A channel's guild never changes, so command-tree syncs (startup,
+# ``/reload-skills``) can reuse a recent lookup instead of hitting
+# ``fetch_channel`` again. The TTL only bounds staleness if the bot is
+# removed from / re-added to a guild while running.
+_GUILD_ID_CACHE_TTL_SECONDS = 300.0
 
 # discord.py emits its reconnect-backoff message via ``log.exception(...)`` at
 # ERROR level, so the actual delay (`Attempting a reconnect in 832.73s`) gets
@@ -468,6 +474,8 @@ class DiscordChannel(BaseChannel):
         # instances in the same process each hold their own refcount; the
         # filter only comes off the logger when the last one releases.
         self._holds_reconnect_annotator: bool = False
+        # target channel id -> (guild id, monotonic timestamp of the lookup).
+        self._guild_cache: dict[int, tuple[int | None, float]] = {}
         # Injected by GatewayManager after construction
         self._session = None  # ChannelSession
         self._registry = None  # AgentRegistry
@@ -2437,15 +2445,23 @@ class DiscordChannel(BaseChannel):
         return "global"
 
     async def _resolve_target_guild_id(self, target_id: int) -> int | None:
+        cached = self._guild_cache.get(target_id)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < _GUILD_ID_CACHE_TTL_SECONDS:
+            return cached[0]
         client = self._require_client()
         channel = client.get_channel(target_id)
         if channel is None:
             try:
                 channel = await client.fetch_channel(target_id)
             except Exception:
+                # Not cached: a transient fetch failure should not pin the
+                # sync to global scope for the whole TTL window.
                 logger.debug("Failed to fetch target channel %s for guild sync", target_id, exc_info=True)
                 return None
-        return self._extract_guild_id(channel)
+        guild_id = self._extract_guild_id(channel)
+        self._guild_cache[target_id] = (guild_id, now)
+        return guild_id
 
     @staticmethod
     def _extract_guild_id(channel) -> int | None:
@@ -66,6 +66,9 @@ class RouteDecision:
 
 _RESERVED_PAYLOAD_KEYS = frozenset({"messages", "model", "max_tokens", "temperature"})
 
+# Linear backoff between router retries: attempt N waits N * this many seconds.
+_RETRY_BACKOFF_SECONDS = 0.25
+
 # Canonical intents — what the v2 router prompt asks the model to output.
 _CANONICAL_INTENTS = frozenset({
     "reply",
@@ -265,7 +268,7 @@ class OpenAICompatibleRouter:
                     exc,
                 )
                 if attempt < attempts:
-                    await asyncio.sleep(0.25 * attempt)
+                    await asyncio.sleep(_RETRY_BACKOFF_SECONDS * attempt)
         if data is None:
             if last_exc:
                 logger.debug("Router final failure detail", exc_info=last_exc)
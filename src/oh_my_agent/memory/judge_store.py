@@ -11,6 +11,7 @@ Judge prompt, not in the store.
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
 import logging
 import os
@@ -33,6 +34,12 @@ VALID_STATUS = frozenset({"active", "superseded"})
 _SCOPE_PRIORITY = {"thread": 0, "skill": 1, "workspace": 2, "global_user": 3}
 _RETRIEVAL_SCOPE_BONUS = {"thread": 1.30, "skill": 1.20, "workspace": 1.10, "global_user": 1.00}
 
+# ``memories.yaml`` is re-read on load and rewritten on every applied action.
+# Prefer the libyaml-backed C loader/dumper (several times faster than the
+# pure-Python ones) and fall back when PyYAML was built without libyaml.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -255,7 +262,7 @@ class JudgeStore:
             return
         try:
             raw = self._entries_path.read_text(encoding="utf-8")
-            data = yaml.safe_load(raw)
+            data = yaml.load(raw, Loader=_YAML_LOADER)
         except Exception as exc:
             logger.warning("Failed to read %s: %s", self._entries_path, exc)
             self._memories = []
@@ -273,7 +280,13 @@ class JudgeStore:
         try:
             payload = [entry.to_dict() for entry in self._memories]
             tmp.write_text(
-                yaml.dump(payload, allow_unicode=True, default_flow_style=False, sort_keys=False),
+                yaml.dump(
+                    payload,
+                    Dumper=_YAML_DUMPER,
+                    allow_unicode=True,
+                    default_flow_style=False,
+                    sort_keys=False,
+                ),
                 encoding="utf-8",
             )
             os.rename(str(tmp), str(self._entries_path))
@@ -305,7 +318,9 @@ class JudgeStore:
     ) -> list[MemoryEntry]:
         scored: list[tuple[float, MemoryEntry]] = []
         for entry in self.get_active():
-            if entry.scope == "thread" and (not thread_id or thread_id not in [e.thread_id for e in entry.evidence_log]):
+            if entry.scope == "thread" and (
+                not thread_id or not any(e.thread_id == thread_id for e in entry.evidence_log)
+            ):
                 continue
             if entry.scope == "skill" and (not skill_name or skill_name not in entry.source_skills):
                 continue
@@ -315,8 +330,11 @@ class JudgeStore:
             scope_bonus = _RETRIEVAL_SCOPE_BONUS.get(entry.scope, 1.0)
             obs_bonus = 1.0 + min(entry.observation_count - 1, 4) * 0.05
             scored.append((base * scope_bonus * obs_bonus, entry))
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [entry for _, entry in scored[:limit]]
+        # Only ``limit`` entries are injected, so keep a bounded heap rather
+        # than sorting every candidate. ``nlargest`` is stable like
+        # ``sorted(..., reverse=True)``, so ties keep file order.
+        top = heapq.nlargest(limit, scored, key=lambda x: x[0])
+        return [entry for _, entry in top]
 
     # ------------------------------------------------------------------
     # Action application (called by Judge)
@@ -437,7 +455,15 @@ class JudgeStore:
             logger.warning("memory_md synthesis returned error: %s", response.error)
             return False
         try:
-            self._memory_md_path.write_text(response.text.strip() + "\n", encoding="utf-8")
+            new_bytes = (response.text.strip() + "\n").encode("utf-8")
+            if self._memory_md_matches(new_bytes):
+                # Same content: skip the rewrite but refresh mtime so
+                # ``should_synthesize`` does not re-trigger on staleness.
+                os.utime(self._memory_md_path)
+                self.clear_synthesis_flag()
+                logger.info("MEMORY.md unchanged after synthesis; skipped rewrite")
+                return True
+            self._memory_md_path.write_bytes(new_bytes)
             self.clear_synthesis_flag()
             logger.info("MEMORY.md synthesized (%d chars)", len(response.text))
             return True
@@ -445,6 +471,14 @@ class JudgeStore:
             logger.warning("Failed to write MEMORY.md: %s", exc)
             return False
 
+    def _memory_md_matches(self, new_bytes: bytes) -> bool:
+        try:
+            if self._memory_md_path.stat().st_size != len(new_bytes):
+                return False
+            return self._memory_md_path.read_bytes() == new_bytes
+        except OSError:
+            return False
+
     # ------------------------------------------------------------------
     # Internals — action handlers
     # ------------------------------------------------------------------
@@ -231,7 +231,9 @@ class MemoryStore(ABC):
     async def add_runtime_event(self, task_id: str, event_type: str, payload: dict[str, Any]) -> None:
         return None
 
-    async def list_runtime_events(self, task_id: str, *, limit: int = 20) -> list[dict[str, Any]]:
+    async def list_runtime_events(
+        self, task_id: str, *, limit: int = 20, event_type: str | None = None
+    ) -> list[dict[str, Any]]:
         return []
 
     async def add_runtime_checkpoint(
@@ -420,6 +422,14 @@ class MemoryStore(ABC):
     ) -> list[dict[str, str]]:
         return []
 
+    async def touch_ephemeral_workspace(
+        self,
+        workspace_key: str,
+        *,
+        last_used_at: str | None = None,
+    ) -> None:
+        return None
+
     async def mark_ephemeral_workspace_cleaned(self, workspace_key: str) -> None:
         return None
 
@@ -1047,7 +1057,7 @@ class SQLiteMemoryStore(MemoryStore):
 
     async def init(self) -> None:
         db = await self._conn()
-        await db.executescript(self.SCHEMA_SQL)
+        await self._apply_schema()
         await self._migrate_runtime_schema()
         await self._run_schema_migrations()
         await db.commit()
@@ -1084,6 +1094,19 @@ class SQLiteMemoryStore(MemoryStore):
         await self._db.close()
         self._db = None
 
+    async def _apply_schema(self) -> None:
+        """Run the schema DDL as one transaction.
+
+        In autocommit mode every ``CREATE`` in the script would commit (and
+        sync the WAL) on its own; a single transaction cuts that to one.
+        """
+        db = await self._conn()
+        try:
+            await db.executescript(f"BEGIN;\n{self.SCHEMA_SQL}\nCOMMIT;")
+        except Exception:
+            await db.rollback()
+            raise
+
     async def _migrate_runtime_schema(self) -> None:
         await self._ensure_column("runtime_tasks", "original_request", "TEXT")
         await self._ensure_column("runtime_tasks", "status_message_id", "TEXT")
@@ -1458,6 +1481,23 @@ class SQLiteMemoryStore(MemoryStore):
             for row in rows
         ]
 
+    async def touch_ephemeral_workspace(
+        self,
+        workspace_key: str,
+        *,
+        last_used_at: str | None = None,
+    ) -> None:
+        """Set ``last_used_at`` (``YYYY-MM-DD HH:MM:SS`` UTC, default now) on an existing row."""
+        async with self._write_lock:
+            db = await self._conn()
+            await db.execute(
+                "UPDATE ephemeral_workspaces "
+                "SET last_used_at=COALESCE(?, CURRENT_TIMESTAMP) "
+                "WHERE workspace_key=?",
+                (last_used_at, workspace_key),
+            )
+            await db.commit()
+
     async def mark_ephemeral_workspace_cleaned(self, workspace_key: str) -> None:
         async with self._write_lock:
             db = await self._conn()
@@ -1889,13 +1929,26 @@ class SQLiteMemoryStore(MemoryStore):
             )
             await db.commit()
 
-    async def list_runtime_events(self, task_id: str, *, limit: int = 20) -> list[dict[str, Any]]:
+    async def list_runtime_events(
+        self, task_id: str, *, limit: int = 20, event_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Return the latest *limit* events for *task_id*, oldest first.
+
+        With *event_type*, only events of that type are considered, so the
+        limit counts matching rows rather than the task's whole history.
+        """
+        clauses = ["task_id=?"]
+        params: list[Any] = [task_id]
+        if event_type is not None:
+            clauses.append("event_type=?")
+            params.append(event_type)
+        params.append(int(limit))
         db = await self._conn()
         cursor = await db.execute(
             "SELECT seq, event_type, payload_json, created_at "
-            "FROM runtime_task_events WHERE task_id=? "
+            f"FROM runtime_task_events WHERE {' AND '.join(clauses)} "
             "ORDER BY seq DESC LIMIT ?",
-            (task_id, int(limit)),
+            params,
         )
         rows = list(await cursor.fetchall())
         items: list[dict[str, Any]] = []
@@ -2943,14 +2996,16 @@ ORDER BY recent_invocations DESC, s.skill_name ASC
         return {"version": 1, "turns": turns, "summaries": summaries}
 
     async def import_data(self, data: dict[str, Any]) -> int:
+        turns = data.get("turns", [])
+        summaries = data.get("summaries", [])
         async with self._write_lock:
             db = await self._conn()
-            count = 0
-
-            for turn in data.get("turns", []):
-                await db.execute(
-                    "INSERT INTO turns (platform, channel_id, thread_id, role, content, author, agent) "
-                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            # One executemany per table instead of a thread hop per row; the
+            # turns_fts triggers still index each inserted turn.
+            await db.executemany(
+                "INSERT INTO turns (platform, channel_id, thread_id, role, content, author, agent) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
                     (
                         turn["platform"],
                         turn["channel_id"],
@@ -2959,14 +3014,14 @@ ORDER BY recent_invocations DESC, s.skill_name ASC
                         turn["content"],
                         turn.get("author"),
                         turn.get("agent"),
-                    ),
-                )
-                count += 1
-
-            for summary in data.get("summaries", []):
-                await db.execute(
-                    "INSERT INTO summaries (platform, channel_id, thread_id, summary, turns_start, turns_end) "
-                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    )
+                    for turn in turns
+                ],
+            )
+            await db.executemany(
+                "INSERT INTO summaries (platform, channel_id, thread_id, summary, turns_start, turns_end) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
                     (
                         summary["platform"],
                         summary["channel_id"],
@@ -2974,12 +3029,13 @@ ORDER BY recent_invocations DESC, s.skill_name ASC
                         summary["summary"],
                         summary["turns_start"],
                         summary["turns_end"],
-                    ),
-                )
-
+                    )
+                    for summary in summaries
+                ],
+            )
             await db.commit()
-        logger.info("Imported %d turns and %d summaries", count, len(data.get("summaries", [])))
-        return count
+        logger.info("Imported %d turns and %d summaries", len(turns), len(summaries))
+        return len(turns)
 
 
 class SQLiteScopedStore(SQLiteMemoryStore):
@@ -3006,7 +3062,7 @@ class SQLiteScopedStore(SQLiteMemoryStore):
         db = await self._conn()
         existing_tables = await self._list_user_tables()
         if not existing_tables:
-            await db.executescript(self.SCHEMA_SQL)
+            await self._apply_schema()
             await self._migrate_runtime_schema()
             await self._drop_unkept_tables()
             await db.commit()
@@ -3024,7 +3080,7 @@ class SQLiteScopedStore(SQLiteMemoryStore):
             # Re-run full schema DDL on existing databases so that
             # newly added tables (CREATE TABLE IF NOT EXISTS) are
             # created even when the DB already has older tables.
-            await db.executescript(self.SCHEMA_SQL)
+            await self._apply_schema()
             await self._drop_unkept_tables()
             await self._migrate_runtime_schema()
             await db.commit()
@@ -3101,6 +3157,7 @@ class SplitSQLiteMemoryStore:
         "resolve_notification_events",
         "upsert_ephemeral_workspace",
         "list_expired_ephemeral_workspaces",
+        "touch_ephemeral_workspace",
         "mark_ephemeral_workspace_cleaned",
         "upsert_automation_state",
         "get_automation_state",
@@ -87,6 +87,18 @@ _BLOCK_REASON_RE = re.compile(r"^\s*BLOCK_REASON:\s*(.+?)\s*$", re.MULTILINE)
 # Both ASCII colon (":") and CJK colon ("：") are accepted.
 _DRAFT_PREFIX_RE = re.compile(r"^\s*(?:draft|草稿)\s*[:：]\s*", re.IGNORECASE)
 
+_PACKAGE_MANAGER_RE = re.compile(r"\b(?:apt|brew)\b")
+
+# Quoted skill names, tried in order: `name`, "name", 'name'.
+_QUOTED_SKILL_NAME_RES = (
+    re.compile(r"`([a-zA-Z0-9][a-zA-Z0-9-_]{0,62})`"),
+    re.compile(r'"([a-zA-Z0-9][a-zA-Z0-9-_]{0,62})"'),
+    re.compile(r"'([a-zA-Z0-9][a-zA-Z0-9-_]{0,62})'"),
+)
+_SKILL_NAME_TOKEN_RE = re.compile(r"[a-zA-Z0-9]+")
+_SLUG_INVALID_CHARS_RE = re.compile(r"[^a-zA-Z0-9-]+")
+_SLUG_DASH_RUN_RE = re.compile(r"-{2,}")
+
 
 def is_long_task_intent(text: str) -> bool:
     lowered = text.lower()
@@ -121,18 +133,13 @@ def strip_draft_prefix(text: str) -> tuple[str, bool]:
 
 
 def extract_skill_name(text: str, existing_skills: set[str] | None = None) -> tuple[str, bool]:
-    patterns = [
-        r"`([a-zA-Z0-9][a-zA-Z0-9-_]{0,62})`",
-        r'"([a-zA-Z0-9][a-zA-Z0-9-_]{0,62})"',
-        r"'([a-zA-Z0-9][a-zA-Z0-9-_]{0,62})'",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    for pattern in _QUOTED_SKILL_NAME_RES:
+        match = pattern.search(text)
         if match:
             name = _normalize_skill_slug(match.group(1))
             return name, bool(existing_skills and name in existing_skills)
 
-    tokens = re.findall(r"[a-zA-Z0-9]+", text.lower())
+    tokens = _SKILL_NAME_TOKEN_RE.findall(text.lower())
     if not tokens:
         name = "new-skill"
     else:
@@ -153,7 +160,7 @@ def evaluate_strict_risk(
         reasons.append("steps_over_8")
     if max_minutes > 20:
         reasons.append("minutes_over_20")
-    if any(hint in lowered for hint in _HIGH_RISK_HINTS) or re.search(r"\b(?:apt|brew)\b", lowered):
+    if any(hint in lowered for hint in _HIGH_RISK_HINTS) or _PACKAGE_MANAGER_RE.search(lowered):
         reasons.append("contains_sensitive_keywords")
     if "across the repo" in lowered or "all files" in lowered or "large refactor" in lowered:
         reasons.append("possible_large_change")
@@ -269,6 +276,6 @@ def build_skill_prompt(
 
 
 def _normalize_skill_slug(value: str) -> str:
-    slug = re.sub(r"[^a-zA-Z0-9-]+", "-", value.strip().lower())
-    slug = re.sub(r"-{2,}", "-", slug).strip("-")
+    slug = _SLUG_INVALID_CHARS_RE.sub("-", value.strip().lower())
+    slug = _SLUG_DASH_RUN_RE.sub("-", slug).strip("-")
     return slug[:64] or "new-skill"
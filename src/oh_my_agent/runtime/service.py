@@ -170,6 +170,47 @@ _TASK_LIVE_STATUSES = {
     TASK_STATUS_PAUSED,
 }
 
+# Thread replies that ``_parse_control_intent`` treats as runtime control
+# commands. Hints are matched against the lowercased reply; lowercasing
+# leaves CJK text unchanged, so one scan covers both languages.
+_CONTROL_STOP_COMMANDS = frozenset({"stop", "stop the task", "cancel"})
+_CONTROL_PAUSE_COMMANDS = frozenset({"pause", "pause the task"})
+_CONTROL_RESUME_PREFIXES = ("resume ", "continue ")
+
+_MERGE_DECISION_STATUSES = frozenset({
+    TASK_STATUS_WAITING_MERGE,
+    TASK_STATUS_APPLIED,
+    TASK_STATUS_MERGE_FAILED,
+})
+_RETRY_MERGE_HINTS = (
+    "retry merge",
+    "merge again",
+    "remerge",
+    "retry the merge",
+    "重新merge",
+    "重新 merge",
+    "重新合并",
+    "重试merge",
+    "重试合并",
+    "再merge",
+    "再试一次merge",
+    "再试一次合并",
+    "能重新merge吗",
+    "能重新合并吗",
+    "清理好了，重新merge",
+    "清理好了，重新合并",
+)
+_MERGE_WAIT_COMMANDS = frozenset({"wait", "hold", "wait for now", "later"})
+_MERGE_WAIT_HINTS = ("先等等", "先等", "等待", "先放着", "先放一放")
+_MERGE_DISCARD_COMMANDS = frozenset({
+    "discard",
+    "drop it",
+    "end this task",
+    "cancel this task",
+    "give up",
+})
+_MERGE_DISCARD_HINTS = ("结束这个任务", "直接结束", "放弃这个任务", "放弃吧", "算了")
+
 _PARTIAL_EXCERPT_MAX_CHARS = 2000
 
 # Retry policy for transient agent failures. Kinds absent from this map are
@@ -371,6 +412,9 @@ class RuntimeService:
         self._workers: list[asyncio.Task] = []
         self._janitor_task: asyncio.Task | None = None
         self._stop_event = asyncio.Event()
+        # Set whenever a task is queued (PENDING) so idle workers claim it
+        # right away instead of waiting out their poll interval.
+        self._task_queued = asyncio.Event()
         # Optional callback that resolves the per-thread short-workspace path
         # used by chat replies. When set, ``_invoke_thread_agent`` (suspended
         # resume + HITL) uses the same cwd so claude --resume hits the same
@@ -2782,9 +2826,15 @@ class RuntimeService:
     async def _worker_loop(self, idx: int) -> None:
         while not self._stop_event.is_set():
             try:
+                # Clear before claiming so a task queued mid-claim still
+                # wakes the wait below.
+                self._task_queued.clear()
                 task = await self._store.claim_pending_runtime_task()
                 if task is None:
-                    await asyncio.sleep(0.8)
+                    try:
+                        await asyncio.wait_for(self._task_queued.wait(), timeout=0.8)
+                    except asyncio.TimeoutError:
+                        pass
                     continue
                 logger.info("Runtime worker=%d claimed task=%s", idx, task.id)
                 await self._run_task(task)
@@ -5646,6 +5696,8 @@ class RuntimeService:
         return self._session_for(task)
 
     async def _signal_status_by_id(self, task: RuntimeTask, status: str) -> None:
+        if status == TASK_STATUS_PENDING:
+            self._task_queued.set()
         emoji = self._emoji_for_status(status)
         if not emoji:
             return
@@ -6775,48 +6827,20 @@ class RuntimeService:
         """Return (action, instruction) if text is a runtime control command, else None."""
         stripped = text.strip()
         lower = stripped.lower()
-        if lower in {"stop", "stop the task", "cancel"}:
+        if lower in _CONTROL_STOP_COMMANDS:
             return ("stop", "")
-        if lower in {"pause", "pause the task"}:
+        if lower in _CONTROL_PAUSE_COMMANDS:
             return ("pause", "")
-        for prefix in ("resume ", "continue "):
+        for prefix in _CONTROL_RESUME_PREFIXES:
             if lower.startswith(prefix):
                 return ("resume", stripped[len(prefix):].strip())
 
-        if task and task.status in {TASK_STATUS_WAITING_MERGE, TASK_STATUS_APPLIED, TASK_STATUS_MERGE_FAILED}:
-            retry_hints = (
-                "retry merge",
-                "merge again",
-                "remerge",
-                "retry the merge",
-                "重新merge",
-                "重新 merge",
-                "重新合并",
-                "重试merge",
-                "重试合并",
-                "再merge",
-                "再试一次merge",
-                "再试一次合并",
-                "能重新merge吗",
-                "能重新合并吗",
-                "清理好了，重新merge",
-                "清理好了，重新合并",
-            )
-            if any(hint in lower for hint in retry_hints) or any(hint in stripped for hint in ("重新合并", "重试合并", "再试一次合并", "能重新合并吗", "清理好了，重新合并")):
+        if task and task.status in _MERGE_DECISION_STATUSES:
+            if any(hint in lower for hint in _RETRY_MERGE_HINTS):
                 return ("retry_merge", "")
-
-            wait_hints = {"wait", "hold", "wait for now", "later"}
-            if lower in wait_hints or any(hint in stripped for hint in ("先等等", "先等", "等待", "先放着", "先放一放")):
+            if lower in _MERGE_WAIT_COMMANDS or any(hint in lower for hint in _MERGE_WAIT_HINTS):
                 return ("wait", "")
-
-            discard_hints = (
-                "discard",
-                "drop it",
-                "end this task",
-                "cancel this task",
-                "give up",
-            )
-            if lower in discard_hints or any(hint in stripped for hint in ("结束这个任务", "直接结束", "放弃这个任务", "放弃吧", "算了")):
+            if lower in _MERGE_DISCARD_COMMANDS or any(hint in lower for hint in _MERGE_DISCARD_HINTS):
                 return ("discard", "")
         return None
 
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+import subprocess
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from oh_my_agent.memory.store import SQLiteMemoryStore
+from oh_my_agent.runtime.types import TASK_STATUS_WAITING_MERGE
+
+
+def init_git_repo(root: Path) -> None:
+    """Create a committed repo that runtime and skill-task tests can run against.
+
+    ``skills/skill-creator/scripts/quick_validate.py`` is the structural check
+    skill tasks use as their test command.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "README.md").write_text("# runtime test\n", encoding="utf-8")
+    (root / "src").mkdir(exist_ok=True)
+    (root / "src" / "__init__.py").write_text("", encoding="utf-8")
+    quick_validate = root / "skills" / "skill-creator" / "scripts" / "quick_validate.py"
+    quick_validate.parent.mkdir(parents=True, exist_ok=True)
+    quick_validate.write_text(
+        "import sys\nfrom pathlib import Path\n"
+        "skill = Path(sys.argv[1])\n"
+        "skill_md = skill / 'SKILL.md'\n"
+        "sys.exit(0 if skill_md.exists() and skill_md.read_text(encoding='utf-8').startswith('---') else 1)\n",
+        encoding="utf-8",
+    )
+    subprocess.run(["git", "init"], cwd=root, check=True, capture_output=True)
+    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=root, check=True, capture_output=True)
+    subprocess.run(["git", "config", "user.name", "Runtime Test"], cwd=root, check=True, capture_output=True)
+    subprocess.run(["git", "add", "."], cwd=root, check=True, capture_output=True)
+    subprocess.run(["git", "commit", "-m", "init"], cwd=root, check=True, capture_output=True)
+
+
+@asynccontextmanager
+async def noop_typing(*_args) -> AsyncIterator[None]:
+    """No-op stand-in for ``channel.typing``.
+
+    Assign it to a mock channel's ``typing`` attribute, or return it from a
+    fake channel's ``typing()`` method.
+    """
+    yield
+
+
+class StatusNotifyingStore(SQLiteMemoryStore):
+    """SQLite store that wakes ``wait_for_store`` when a task or notification row changes."""
+
+    def __init__(self, db_path: str | Path) -> None:
+        super().__init__(db_path)
+        self.changed = asyncio.Condition()
+
+    async def _notify_changed(self) -> None:
+        async with self.changed:
+            self.changed.notify_all()
+
+    async def update_runtime_task(self, task_id: str, **updates):
+        task = await super().update_runtime_task(task_id, **updates)
+        await self._notify_changed()
+        return task
+
+    async def claim_pending_runtime_task(self):
+        task = await super().claim_pending_runtime_task()
+        await self._notify_changed()
+        return task
+
+    async def requeue_inflight_runtime_tasks(self) -> int:
+        count = await super().requeue_inflight_runtime_tasks()
+        await self._notify_changed()
+        return count
+
+    async def create_notification_event(self, **kwargs):
+        record = await super().create_notification_event(**kwargs)
+        await self._notify_changed()
+        return record
+
+
+async def wait_for_store(store: StatusNotifyingStore, probe, timeout: float = 8.0):
+    """Await ``probe()`` until it returns something truthy; ``None`` on timeout."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    async with store.changed:
+        while True:
+            result = await probe()
+            if result:
+                return result
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(store.changed.wait(), remaining)
+            except TimeoutError:
+                return None
+
+
+async def wait_for_status(
+    store: StatusNotifyingStore, task_id: str, expected: set[str], timeout: float = 8.0
+):
+    async def _reached():
+        task = await store.get_runtime_task(task_id)
+        return task if task and task.status in expected else None
+
+    task = await wait_for_store(store, _reached, timeout)
+    if task is not None:
+        return task
+    task = await store.get_runtime_task(task_id)
+    raise AssertionError(f"Task {task_id} did not reach {expected}, got {task.status if task else 'missing'}")
+
+
+async def wait_for_merge_gate(store: StatusNotifyingStore, task_id: str, timeout: float = 8.0):
+    """Wait until the worker has parked ``task_id`` at the merge gate.
+
+    The status flips to WAITING_MERGE before the worker finishes its git
+    diff for the decision surface; the waiting-merge notification row is
+    the last thing it records, so merging before then races the worktree.
+    """
+    notifications = await wait_for_store(
+        store,
+        lambda: store.list_active_notification_events(
+            dedupe_key=f"task:{task_id}:waiting_merge",
+            limit=10,
+        ),
+        timeout,
+    )
+    task = await store.get_runtime_task(task_id)
+    if notifications is None or task is None or task.status != TASK_STATUS_WAITING_MERGE:
+        raise AssertionError(
+            f"Task {task_id} did not reach the merge gate, got {task.status if task else 'missing'}"
+        )
+    return task
+
+
+@pytest.fixture(scope="session")
+def git_template(tmp_path_factory) -> Path:
+    """Committed repo built once per session; tests copy it instead of re-running git."""
+    root = tmp_path_factory.mktemp("git-template") / "repo"
+    init_git_repo(root)
+    return root
+
+
+@pytest_asyncio.fixture
+async def memory_store() -> AsyncIterator[SQLiteMemoryStore]:
+    """Initialised store on a fresh in-memory DB.
+
+    Nothing in the tests reopens a store by path, so ``:memory:`` skips the
+    disk and WAL I/O a file-backed DB would pay for every test.
+    """
+    store = SQLiteMemoryStore(":memory:")
+    await store.init()
+    yield store
+    await store.close()
+
+
+@pytest.fixture(autouse=True)
+def _cancel_leaked_tasks(request):
+    """Cancel tasks a test left behind on the shared session event loop.
+
+    Async tests run on one session-scoped loop (see ``pyproject.toml``), so a
+    background task a test forgets to stop would otherwise keep running into
+    the next test.
+    """
+    yield
+    if request.node.get_closest_marker("asyncio") is None:
+        return
+    loop = asyncio.get_event_loop_policy().get_event_loop()
+    if loop.is_closed() or loop.is_running():
+        return
+    leaked = [task for task in asyncio.all_tasks(loop) if not task.done()]
+    if not leaked:
+        return
+    for task in leaked:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*leaked, return_exceptions=True))
@@ -14,6 +14,9 @@ from tests.harness.runner import run_scenario
 
 SCENARIOS_DIR = Path(__file__).parent / "scenarios"
 SCENARIO_FILES = sorted(SCENARIOS_DIR.glob("*.yaml"))
+# The passing run of the regression scenario finishes in well under a
+# second; under the regression its last await can only time out.
+REGRESSION_AWAIT_TIMEOUT_SECONDS = 5.0
 
 
 @pytest.mark.parametrize("scenario_path", SCENARIO_FILES, ids=lambda p: p.stem)
@@ -43,6 +46,10 @@ async def test_l_level_regression_caught_when_resolver_disabled() -> None:
 
     spec_path = SCENARIOS_DIR / "bilibili_chat_reply_resume.yaml"
     spec = load_yaml(spec_path)
+    for step in spec.steps:
+        if "await" in step:
+            budget = float(step["await"].get("timeout_seconds") or 30.0)
+            step["await"]["timeout_seconds"] = min(budget, REGRESSION_AWAIT_TIMEOUT_SECONDS)
     env = await bootstrap_harness_env(spec)
     env.runtime.set_workspace_resolver(None)
     reset_event_cursor(env)
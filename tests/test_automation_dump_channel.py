@@ -17,6 +17,7 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 
 from oh_my_agent.automation import (
     DumpChannelConfig,
@@ -227,7 +228,7 @@ def test_missing_target_channel_yields_no_notify_channel_id(tmp_path):
 # ── runtime redirect ─────────────────────────────────────────────────── #
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def store(tmp_path):
     s = SQLiteMemoryStore(tmp_path / "rt.db")
     await s.init()
@@ -5,6 +5,7 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 
 from oh_my_agent.gateway.base import IncomingMessage
 from oh_my_agent.gateway.manager import GatewayManager
@@ -13,7 +14,7 @@ from oh_my_agent.memory.store import SQLiteMemoryStore
 from oh_my_agent.runtime.types import AutomationPost
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def store(tmp_path):
     s = SQLiteMemoryStore(tmp_path / "posts.db")
     await s.init()
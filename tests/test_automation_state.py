@@ -1,11 +1,12 @@
 """Tests for automation runtime state persistence (Phase 2.1)."""
 
 import pytest
+import pytest_asyncio
 
 from oh_my_agent.memory.store import SQLiteMemoryStore
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def store(tmp_path):
     s = SQLiteMemoryStore(tmp_path / "test.db")
     await s.init()
@@ -15,6 +15,7 @@ from oh_my_agent.automation.scheduler import ScheduledJob, Scheduler
 from oh_my_agent.gateway.manager import GatewayManager
 from oh_my_agent.gateway.session import ChannelSession
 from oh_my_agent.memory.store import SQLiteMemoryStore
+from tests.conftest import noop_typing
 
 
 def _write_yaml(path: Path, text: str) -> None:
@@ -45,9 +46,7 @@ def _make_channel(channel_id: str = "100", *, dm_support: bool = True):
     channel.channel_id = channel_id
     channel.send = AsyncMock()
     channel.create_thread = AsyncMock(return_value="thr")
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
+    channel.typing = noop_typing
     if dm_support:
         channel.ensure_dm_channel = AsyncMock(return_value="dm-thread")
     else:
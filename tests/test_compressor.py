@@ -1,13 +1,14 @@
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 
 from oh_my_agent.agents.base import AgentResponse
 from oh_my_agent.memory.compressor import HistoryCompressor
 from oh_my_agent.memory.store import SQLiteMemoryStore
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def store(tmp_path):
     s = SQLiteMemoryStore(tmp_path / "test.db")
     await s.init()
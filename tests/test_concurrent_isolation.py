@@ -17,7 +17,8 @@ from oh_my_agent.runtime import (
     TASK_STATUS_WAITING_USER_INPUT,
     RuntimeService,
 )
-from tests.test_runtime_service import _FakeChannel, _init_git_repo
+from tests.conftest import init_git_repo, noop_typing
+from tests.test_runtime_service import _FakeChannel
 
 
 class _ThreadEchoAgent(BaseAgent):
@@ -81,21 +82,13 @@ class _GatewayChannel:
     async def stop(self) -> None:
         return None
 
-    class _Typing:
-        async def __aenter__(self):
-            return None
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
-
     def typing(self, thread_id: str):
-        del thread_id
-        return self._Typing()
+        return noop_typing(thread_id)
 
 
 async def _build_concurrent_runtime(tmp_path: Path):
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    init_git_repo(repo)
     db_path = tmp_path / "runtime.db"
     store = SQLiteMemoryStore(db_path)
     await store.init()
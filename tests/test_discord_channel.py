@@ -65,6 +65,44 @@ async def test_sync_command_tree_moves_commands_to_guild_and_clears_global():
     ]
 
 
+@pytest.mark.asyncio
+async def test_resolve_target_guild_id_caches_lookup():
+    channel = DiscordChannel(token="x", channel_id="100")
+    fetches: list[int] = []
+
+    async def _fetch_channel(target_id: int):
+        fetches.append(target_id)
+        return SimpleNamespace(guild=SimpleNamespace(id=12345), guild_id=None)
+
+    channel._client = SimpleNamespace(  # type: ignore[assignment]
+        get_channel=lambda _target_id: None,
+        fetch_channel=_fetch_channel,
+    )
+
+    assert await channel._resolve_target_guild_id(100) == 12345
+    assert await channel._resolve_target_guild_id(100) == 12345
+    assert fetches == [100]
+
+
+@pytest.mark.asyncio
+async def test_resolve_target_guild_id_does_not_cache_fetch_failure():
+    channel = DiscordChannel(token="x", channel_id="100")
+    fetches: list[int] = []
+
+    async def _fetch_channel(target_id: int):
+        fetches.append(target_id)
+        raise RuntimeError("discord unavailable")
+
+    channel._client = SimpleNamespace(  # type: ignore[assignment]
+        get_channel=lambda _target_id: None,
+        fetch_channel=_fetch_channel,
+    )
+
+    assert await channel._resolve_target_guild_id(100) is None
+    assert await channel._resolve_target_guild_id(100) is None
+    assert fetches == [100, 100]
+
+
 class _FakeDiscordThread:
     def __init__(self) -> None:
         self.calls: list[dict] = []
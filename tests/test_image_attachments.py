@@ -9,6 +9,7 @@ from oh_my_agent.agents.base import AgentResponse, BaseAgent
 from oh_my_agent.agents.registry import AgentRegistry
 from oh_my_agent.gateway.base import Attachment, IncomingMessage
 from oh_my_agent.gateway.session import ChannelSession
+from tests.conftest import noop_typing
 
 # ---------------------------------------------------------------------------
 # Attachment.is_image
@@ -316,9 +317,7 @@ def _make_channel():
     channel.channel_id = "100"
     channel.create_thread = AsyncMock(return_value="thread-1")
     channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
+    channel.typing = noop_typing
     return channel
 
 
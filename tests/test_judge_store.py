@@ -137,6 +137,24 @@ async def test_save_and_reload_round_trip(store_dir: Path):
     assert store2.get_active()[0].summary == "uses zsh"
 
 
+@pytest.mark.asyncio
+async def test_save_keeps_unicode_readable(store_dir: Path):
+    store = _build_store(store_dir)
+    await store.load()
+    await store.apply_actions([
+        {"op": "add", "summary": "用户喜欢喝茶", "category": "preference", "evidence": "记一下：我喜欢喝茶"}
+    ], thread_id="thread")
+
+    text = (store_dir / "memories.yaml").read_text(encoding="utf-8")
+    assert "用户喜欢喝茶" in text
+
+    store2 = _build_store(store_dir)
+    await store2.load()
+    entry = store2.get_active()[0]
+    assert entry.summary == "用户喜欢喝茶"
+    assert entry.evidence_log[0].snippet == "记一下：我喜欢喝茶"
+
+
 @pytest.mark.asyncio
 async def test_should_synthesize_dirty_then_clean(store_dir: Path):
     store = _build_store(store_dir, synthesize_after_seconds=3600)
@@ -195,6 +213,20 @@ async def test_get_relevant_scope_filtering(store_dir: Path):
     assert "workspace knowledge" not in summaries
 
 
+@pytest.mark.asyncio
+async def test_get_relevant_limit_keeps_highest_scores_in_stable_order(store_dir: Path):
+    store = _build_store(store_dir)
+    await store.load()
+    await store.apply_actions([
+        {"op": "add", "summary": "low", "confidence": 0.3, "evidence": ""},
+        {"op": "add", "summary": "tie-first", "confidence": 0.9, "evidence": ""},
+        {"op": "add", "summary": "mid", "confidence": 0.6, "evidence": ""},
+        {"op": "add", "summary": "tie-second", "confidence": 0.9, "evidence": ""},
+    ])
+    relevant = store.get_relevant(limit=3)
+    assert [m.summary for m in relevant] == ["tie-first", "tie-second", "mid"]
+
+
 @pytest.mark.asyncio
 async def test_synthesize_memory_md_writes_file(store_dir: Path):
     store = _build_store(store_dir)
@@ -222,6 +254,42 @@ async def test_synthesize_memory_md_writes_file(store_dir: Path):
     assert store.should_synthesize() is False
 
 
+@pytest.mark.asyncio
+async def test_synthesize_memory_md_skips_identical_rewrite(store_dir: Path, monkeypatch):
+    store = _build_store(store_dir, synthesize_after_seconds=3600)
+    await store.load()
+    await store.apply_actions([
+        {"op": "add", "summary": "user likes tea", "category": "preference", "scope": "global_user", "confidence": 0.9, "evidence": ""},
+    ])
+
+    class FakeResponse:
+        text = "# Memory\n\n## preference\n- You like tea\n"
+        error = None
+
+    class FakeRegistry:
+        async def run(self, prompt, run_label=None):
+            return object(), FakeResponse()
+
+    assert await store.synthesize_memory_md(FakeRegistry()) is True
+    md_path = store_dir / "MEMORY.md"
+    old = time.time() - 7200
+    os.utime(md_path, (old, old))
+    assert store.should_synthesize() is True
+
+    writes: list[Path] = []
+    original_write_bytes = Path.write_bytes
+
+    def _tracking_write_bytes(self, data):
+        writes.append(self)
+        return original_write_bytes(self, data)
+
+    monkeypatch.setattr(Path, "write_bytes", _tracking_write_bytes)
+    assert await store.synthesize_memory_md(FakeRegistry()) is True
+    assert writes == []
+    # mtime refreshed so staleness does not immediately re-trigger synthesis
+    assert store.should_synthesize() is False
+
+
 def test_parse_judge_actions_handles_fenced_and_object_forms():
     raw = """```json
 {"actions": [{"op": "no_op", "reason": "ok"}]}
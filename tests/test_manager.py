@@ -1,6 +1,8 @@
 import asyncio
 import sqlite3
+from dataclasses import dataclass
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -19,6 +21,37 @@ from oh_my_agent.utils.errors import (
     USER_MSG_INTERNAL,
     USER_MSG_STORE_FAILURE,
 )
+from tests.conftest import noop_typing
+
+# Canned agent replies shared by the handle_message tests. AgentResponse is
+# a plain dataclass, but GatewayManager only reads it (unlike
+# RuntimeService, which annotates failed responses), so sharing is safe.
+_RESP_REPLY = AgentResponse(text="reply")
+_RESP_HI = AgentResponse(text="hi")
+_RESP_ANSWER = AgentResponse(text="answer")
+_RESP_DONE = AgentResponse(text="done")
+_RESP_ERR = AgentResponse(text="", error="boom")
+
+# ScheduledJob is frozen, so the dispatch tests can share these instances.
+# IncomingMessage is not cached the same way: handle_message assigns
+# ``msg.thread_id`` when it creates a thread.
+_TICK_JOB = ScheduledJob(
+    name="tick",
+    platform="discord",
+    channel_id="100",
+    thread_id=None,
+    prompt="run",
+    interval_seconds=60,
+)
+_DM_JOB = ScheduledJob(
+    name="dm",
+    platform="discord",
+    channel_id="100",
+    delivery="dm",
+    target_user_id="42",
+    prompt="run",
+    interval_seconds=60,
+)
 
 
 def _make_msg(thread_id=None, content="hello", author_id=None, system=False) -> IncomingMessage:
@@ -33,17 +66,49 @@ def _make_msg(thread_id=None, content="hello", author_id=None, system=False) ->
     )
 
 
+def _async_returning(value):
+    """Plain coroutine stub for mocks that only return a canned value.
+
+    Much cheaper to build than ``AsyncMock``; calls are recorded on
+    ``.calls`` as ``(args, kwargs)`` for the few tests that inspect them.
+    """
+    calls: list[tuple[tuple, dict]] = []
+
+    async def _stub(*args, **kwargs):
+        calls.append((args, kwargs))
+        return value
+
+    _stub.calls = calls  # type: ignore[attr-defined]
+    return _stub
+
+
+def _make_channel(*, platform: str = "discord", thread_id: str | None = "thread-1") -> MagicMock:
+    """Channel mock with the async surface ``handle_message`` touches.
+
+    Built fresh per call rather than ``copy.copy``-ing a template: copies of
+    a ``MagicMock`` share its child-mock registry, so attributes created in
+    one test would leak into every other copy.
+
+    ``thread_id=None`` is for tests asserting no thread gets created:
+    ``create_thread`` is then a plain ``MagicMock`` (``assert_not_called``
+    still works) and no ``AsyncMock`` is built for it.
+    """
+    channel = MagicMock()
+    channel.platform = platform
+    channel.channel_id = "100"
+    if thread_id is None:
+        channel.create_thread = MagicMock()
+    else:
+        channel.create_thread = AsyncMock(return_value=thread_id)
+    channel.send = AsyncMock()
+    channel.stop = _async_returning(None)
+    channel.typing = noop_typing
+    return channel
+
+
 def _make_session(channel=None, registry=None) -> ChannelSession:
     if channel is None:
-        channel = MagicMock()
-        channel.platform = "discord"
-        channel.channel_id = "100"
-        channel.create_thread = AsyncMock(return_value="thread-1")
-        channel.send = AsyncMock()
-        channel.stop = AsyncMock()
-        channel.typing = MagicMock()
-        channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-        channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
+        channel = _make_channel()
     if registry is None:
         registry = MagicMock(spec=AgentRegistry)
     return ChannelSession(
@@ -54,6 +119,61 @@ def _make_session(channel=None, registry=None) -> ChannelSession:
     )
 
 
+@pytest.fixture
+def channel() -> MagicMock:
+    return _make_channel(thread_id="t1")
+
+
+@pytest.fixture
+def registry() -> MagicMock:
+    return MagicMock(spec=AgentRegistry)
+
+
+@pytest.fixture
+def gm() -> GatewayManager:
+    # Function-scoped on purpose: handle_message mutates the manager
+    # (session index, in-flight task set, shutdown Event).
+    return GatewayManager([])
+
+
+@dataclass
+class _Ctx:
+    """Channel, registry, session and manager wired the usual way."""
+
+    channel: MagicMock
+    registry: MagicMock
+    session: ChannelSession
+    gm: GatewayManager
+    agent: MagicMock
+
+    def respond(self, response: AgentResponse, *, agent_name: str = "claude") -> None:
+        self.agent.name = agent_name
+        self.registry.agents = [self.agent]
+        self.registry.run = AsyncMock(return_value=(self.agent, response))
+
+    async def send(self, **msg_kwargs) -> IncomingMessage:
+        """Drive one ``handle_message`` round trip for a message built from ``msg_kwargs``."""
+        msg = _make_msg(**msg_kwargs)
+        await self.gm.handle_message(self.session, self.registry, msg)
+        return msg
+
+
+@pytest.fixture
+def ctx(channel, registry, gm) -> _Ctx:
+    return _Ctx(
+        channel=channel,
+        registry=registry,
+        session=_make_session(channel=channel, registry=registry),
+        gm=gm,
+        agent=MagicMock(),
+    )
+
+
+@pytest.fixture
+def gated_gm() -> GatewayManager:
+    return GatewayManager([], owner_user_ids={"42"})
+
+
 class _ResumeClearingAgent(BaseAgent):
     def __init__(self, name: str = "codex") -> None:
         self._name = name
@@ -91,41 +211,28 @@ class _ThreadAwareOKAgent(BaseAgent):
         return AgentResponse(text=self._response)
 
 
-def test_thread_name_truncates_at_90_chars():
-    long = "a" * 200
-    name = GatewayManager._thread_name(long)
-    assert len(name) <= 94  # 90 + "..."
-    assert name.endswith("...")
-
-
-def test_thread_name_short_message_unchanged():
-    name = GatewayManager._thread_name("short message")
-    assert name == "short message"
-
-
-def test_thread_name_uses_first_line_only():
-    name = GatewayManager._thread_name("line one\nline two")
-    assert name == "line one"
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ("a" * 200, "a" * 90 + "..."),
+        ("short message", "short message"),
+        ("line one\nline two", "line one"),
+    ],
+    ids=["truncates_at_90_chars", "short_message_unchanged", "uses_first_line_only"],
+)
+def test_thread_name(content, expected):
+    assert GatewayManager._thread_name(content) == expected
 
 
 @pytest.mark.asyncio
-async def test_handle_message_creates_thread_when_no_thread_id():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="new-thread")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
+async def test_handle_message_creates_thread_when_no_thread_id(registry, gm):
+    channel = _make_channel(thread_id="new-thread")
 
     mock_agent = MagicMock()
     mock_agent.name = "claude"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="reply")))
+    registry.run = AsyncMock(return_value=(mock_agent, _RESP_REPLY))
 
     session = _make_session(channel=channel, registry=registry)
-    gm = GatewayManager([])
 
     msg = _make_msg(thread_id=None, content="new question")
     await gm.handle_message(session, registry, msg)
@@ -138,23 +245,13 @@ async def test_handle_message_creates_thread_when_no_thread_id():
 
 
 @pytest.mark.asyncio
-async def test_handle_message_uses_existing_thread_id():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock()
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
+async def test_handle_message_uses_existing_thread_id(registry, gm):
+    channel = _make_channel(thread_id=None)
     mock_agent = MagicMock()
     mock_agent.name = "claude"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="hi")))
+    registry.run = AsyncMock(return_value=(mock_agent, _RESP_HI))
 
     session = _make_session(channel=channel, registry=registry)
-    gm = GatewayManager([])
 
     msg = _make_msg(thread_id="existing-thread", content="follow up")
     await gm.handle_message(session, registry, msg)
@@ -165,69 +262,41 @@ async def test_handle_message_uses_existing_thread_id():
 
 
 @pytest.mark.asyncio
-async def test_handle_message_logs_direct_reply_purpose(caplog):
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock()
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
-    mock_agent = MagicMock()
-    mock_agent.name = "claude"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.agents = [mock_agent]
-    registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="hi")))
-
-    session = _make_session(channel=channel, registry=registry)
-    gm = GatewayManager([])
+async def test_handle_message_logs_direct_reply_purpose(caplog, ctx):
+    ctx.respond(_RESP_HI)
 
     with caplog.at_level("INFO"):
-        await gm.handle_message(session, registry, _make_msg(thread_id="existing-thread", content="follow up"))
+        await ctx.send(thread_id="existing-thread", content="follow up")
 
     assert "AGENT starting purpose=direct_reply" in caplog.text
     assert "AGENT_OK purpose=direct_reply agent=claude" in caplog.text
 
 
 @pytest.mark.asyncio
-async def test_handle_message_logs_explicit_skill_dispatch_to_task(caplog, tmp_path):
+async def test_handle_message_logs_explicit_skill_dispatch_to_task(caplog, tmp_path, channel, registry):
     """Explicit ``/skill_name`` now goes through ``create_artifact_task``
     (PR2.1: skill paths unification). The router and the inline
     ``AgentRegistry.run`` are bypassed; the dispatch log records the
     skill and the create_artifact_task hand-off."""
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
     mock_agent = MagicMock()
     mock_agent.name = "claude"
-    registry = MagicMock(spec=AgentRegistry)
     registry.agents = [mock_agent]
-    registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="reply")))
+    registry.run = AsyncMock(return_value=(mock_agent, _RESP_REPLY))
 
-    runtime = MagicMock()
-    runtime.maybe_handle_thread_context = AsyncMock(return_value=False)
-    runtime.maybe_handle_incoming = AsyncMock(return_value=False)
-    runtime.create_artifact_task = AsyncMock()
-    runtime.create_skill_task = AsyncMock()
+    runtime = SimpleNamespace(
+        maybe_handle_thread_context=_async_returning(False),
+        maybe_handle_incoming=_async_returning(False),
+        create_artifact_task=AsyncMock(),
+        create_skill_task=AsyncMock(),
+    )
 
-    router = MagicMock()
-    router.confidence_threshold = 0.55
-    router.route = AsyncMock()
+    router = SimpleNamespace(confidence_threshold=0.55, route=AsyncMock())
 
     skills_root = tmp_path / "skills"
     skill_dir = skills_root / "top-5-daily-news"
     skill_dir.mkdir(parents=True)
     (skill_dir / "SKILL.md").write_text("name: top-5-daily-news\n", encoding="utf-8")
-    syncer = MagicMock()
-    syncer._skills_path = skills_root  # noqa: SLF001
+    syncer = SimpleNamespace(_skills_path=skills_root)
 
     session = _make_session(channel=channel, registry=registry)
     gm = GatewayManager(
@@ -251,21 +320,11 @@ async def test_handle_message_logs_explicit_skill_dispatch_to_task(caplog, tmp_p
 
 
 @pytest.mark.asyncio
-async def test_handle_message_injects_judge_store_relevant(tmp_path):
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock()
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
+async def test_handle_message_injects_judge_store_relevant(tmp_path, channel, registry):
     mock_agent = MagicMock()
     mock_agent.name = "claude"
-    registry = MagicMock(spec=AgentRegistry)
     registry.agents = [mock_agent]
-    registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="reply")))
+    registry.run = AsyncMock(return_value=(mock_agent, _RESP_REPLY))
 
     session = _make_session(channel=channel, registry=registry)
     judge_store = MagicMock()
@@ -296,37 +355,27 @@ async def test_handle_message_injects_judge_store_relevant(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_handle_message_passes_log_path_for_chat_runs(tmp_path):
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock()
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
+async def test_handle_message_passes_log_path_for_chat_runs(tmp_path, channel, registry):
     mock_agent = MagicMock()
     mock_agent.name = "codex"
-    registry = MagicMock(spec=AgentRegistry)
     registry.agents = [mock_agent]
     async def _run(*args, **kwargs):
         callback = kwargs.get("on_agent_run")
         if callback is not None:
             await callback(
                 agent=mock_agent,
-                response=AgentResponse(text="hi"),
+                response=_RESP_HI,
                 log_path=tmp_path / "chat-thread-codex.log",
                 duration_s=0.25,
             )
-        return mock_agent, AgentResponse(text="hi")
+        return mock_agent, _RESP_HI
 
     registry.run = AsyncMock(side_effect=_run)
 
     runtime = MagicMock()
     runtime.chat_agent_log_base_path.return_value = tmp_path / "chat-thread.log"
-    runtime.maybe_handle_thread_context = AsyncMock(return_value=False)
-    runtime.maybe_handle_incoming = AsyncMock(return_value=False)
+    runtime.maybe_handle_thread_context = _async_returning(False)
+    runtime.maybe_handle_incoming = _async_returning(False)
     runtime.record_thread_agent_run = AsyncMock()
 
     session = _make_session(channel=channel, registry=registry)
@@ -340,20 +389,10 @@ async def test_handle_message_passes_log_path_for_chat_runs(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_handle_message_intercepts_auth_control_frame():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock()
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
+async def test_handle_message_intercepts_auth_control_frame(channel, registry):
     mock_agent = MagicMock()
     mock_agent.name = "codex"
     mock_agent.get_session_id.return_value = "sess-123"
-    registry = MagicMock(spec=AgentRegistry)
     registry.agents = [mock_agent]
     registry.run = AsyncMock(
         return_value=(
@@ -369,8 +408,8 @@ async def test_handle_message_intercepts_auth_control_frame():
     )
 
     runtime = MagicMock()
-    runtime.maybe_handle_thread_context = AsyncMock(return_value=False)
-    runtime.maybe_handle_incoming = AsyncMock(return_value=False)
+    runtime.maybe_handle_thread_context = _async_returning(False)
+    runtime.maybe_handle_incoming = _async_returning(False)
     runtime.mark_thread_auth_required = AsyncMock(return_value="Thread `thread-1` is waiting for `bilibili` login.")
 
     session = _make_session(channel=channel, registry=registry)
@@ -388,20 +427,10 @@ async def test_handle_message_intercepts_auth_control_frame():
 
 
 @pytest.mark.asyncio
-async def test_handle_message_intercepts_ask_user_control_frame():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock()
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
+async def test_handle_message_intercepts_ask_user_control_frame(channel, registry):
     mock_agent = MagicMock()
     mock_agent.name = "codex"
     mock_agent.get_session_id.return_value = "sess-123"
-    registry = MagicMock(spec=AgentRegistry)
     registry.agents = [mock_agent]
     registry.run = AsyncMock(
         return_value=(
@@ -420,8 +449,8 @@ async def test_handle_message_intercepts_ask_user_control_frame():
     )
 
     runtime = MagicMock()
-    runtime.maybe_handle_thread_context = AsyncMock(return_value=False)
-    runtime.maybe_handle_incoming = AsyncMock(return_value=False)
+    runtime.maybe_handle_thread_context = _async_returning(False)
+    runtime.maybe_handle_incoming = _async_returning(False)
     runtime.mark_thread_ask_user_required = AsyncMock(return_value="Thread `thread-1` is waiting for input.")
 
     session = _make_session(channel=channel, registry=registry)
@@ -439,60 +468,29 @@ async def test_handle_message_intercepts_ask_user_control_frame():
 
 
 @pytest.mark.asyncio
-async def test_handle_message_logs_error_purpose(caplog):
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
-    mock_agent = MagicMock()
-    mock_agent.name = "claude"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.agents = [mock_agent]
-    registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="", error="boom")))
-
-    session = _make_session(channel=channel, registry=registry)
-    gm = GatewayManager([])
+async def test_handle_message_logs_error_purpose(caplog, ctx):
+    ctx.respond(_RESP_ERR)
 
     with caplog.at_level("INFO"):
-        await gm.handle_message(session, registry, _make_msg(thread_id="t1", content="oops"))
+        await ctx.send(thread_id="t1", content="oops")
 
     assert "AGENT starting purpose=direct_reply" in caplog.text
     assert "AGENT_ERROR purpose=direct_reply agent=claude" in caplog.text
 
 
 @pytest.mark.asyncio
-async def test_handle_message_logs_running_elapsed_for_slow_direct_reply(caplog):
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock()
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
-    mock_agent = MagicMock()
-    mock_agent.name = "claude"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.agents = [mock_agent]
+async def test_handle_message_logs_running_elapsed_for_slow_direct_reply(caplog, ctx):
+    ctx.respond(_RESP_HI)
 
     async def _slow_run(*args, **kwargs):
         await asyncio.sleep(0.02)
-        return mock_agent, AgentResponse(text="hi")
-
-    registry.run = AsyncMock(side_effect=_slow_run)
+        return ctx.agent, _RESP_HI
 
-    session = _make_session(channel=channel, registry=registry)
-    gm = GatewayManager([])
-    gm._agent_progress_log_interval_seconds = 0.005
+    ctx.registry.run = AsyncMock(side_effect=_slow_run)
+    ctx.gm._agent_progress_log_interval_seconds = 0.005
 
     with caplog.at_level("INFO"):
-        await gm.handle_message(session, registry, _make_msg(thread_id="existing-thread", content="follow up"))
+        await ctx.send(thread_id="existing-thread", content="follow up")
 
     assert "AGENT starting purpose=direct_reply" in caplog.text
     assert "AGENT_RUNNING purpose=direct_reply elapsed=" in caplog.text
@@ -504,14 +502,8 @@ async def test_skill_invocation_is_recorded_and_binds_first_response_message(tmp
     store = SQLiteMemoryStore(tmp_path / "runtime.db")
     await store.init()
     try:
-        channel = MagicMock()
-        channel.platform = "discord"
-        channel.channel_id = "100"
-        channel.create_thread = AsyncMock(return_value="thread-1")
-        channel.send = AsyncMock(side_effect=["msg-1"])
-        channel.typing = MagicMock()
-        channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-        channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
+        channel = _make_channel()
+        channel.send.side_effect = ["msg-1"]
 
         mock_agent = MagicMock()
         mock_agent.name = "codex"
@@ -569,14 +561,8 @@ async def test_auto_disabled_skills_are_hidden_from_router_entries_but_explicit_
     try:
         await store.set_skill_auto_disabled("weather", disabled=True, reason="too many failures")
 
-        channel = MagicMock()
-        channel.platform = "discord"
-        channel.channel_id = "100"
-        channel.create_thread = AsyncMock(return_value="thread-1")
-        channel.send = AsyncMock(side_effect=["msg-1"])
-        channel.typing = MagicMock()
-        channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-        channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
+        channel = _make_channel()
+        channel.send.side_effect = ["msg-1"]
 
         mock_agent = MagicMock()
         mock_agent.name = "codex"
@@ -664,44 +650,29 @@ async def test_recompute_skill_health_auto_disables_unhealthy_skill(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_handle_message_error_response_sent_and_history_cleaned():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
-    mock_agent = MagicMock()
-    mock_agent.name = "claude"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="", error="boom")))
-
-    session = _make_session(channel=channel, registry=registry)
-    gm = GatewayManager([])
+@pytest.mark.parametrize(
+    ("response", "expected_sent", "expected_roles"),
+    [
+        # A failed turn is reported and popped from history.
+        (_RESP_ERR, USER_MSG_AGENT_CRASH, []),
+        (_RESP_ANSWER, "-# via **claude**\nanswer", ["user", "assistant"]),
+    ],
+    ids=["error_response_sent_and_history_cleaned", "appends_to_history"],
+)
+async def test_handle_message_history(ctx, response, expected_sent, expected_roles):
+    ctx.respond(response)
 
-    msg = _make_msg(thread_id=None, content="oops")
-    await gm.handle_message(session, registry, msg)
+    await ctx.send(thread_id=None, content="question")
 
-    sent = channel.send.call_args[0][1]
-    assert sent == USER_MSG_AGENT_CRASH
-    # History should be empty (failed turn was popped)
-    assert await session.get_history("t1") == []
+    assert ctx.channel.send.call_args[0][1] == expected_sent
+    history = await ctx.session.get_history("t1")
+    assert [turn["role"] for turn in history] == expected_roles
+    if history:
+        assert history[1]["agent"] == "claude"
 
 
 @pytest.mark.asyncio
-async def test_handle_message_deletes_stale_session_after_fallback_success(tmp_path):
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
+async def test_handle_message_deletes_stale_session_after_fallback_success(tmp_path, channel, gm):
     flaky = _ResumeClearingAgent("codex")
     healthy = _ThreadAwareOKAgent("claude", "answer")
     registry = AgentRegistry([flaky, healthy])
@@ -710,7 +681,6 @@ async def test_handle_message_deletes_stale_session_after_fallback_success(tmp_p
     store = SQLiteMemoryStore(tmp_path / "memory.db")
     await store.init()
 
-    gm = GatewayManager([])
     gm.set_memory_store(store)
     await store.save_session("discord", "100", "t1", "codex", "sess-stale")
 
@@ -723,204 +693,65 @@ async def test_handle_message_deletes_stale_session_after_fallback_success(tmp_p
 
 
 @pytest.mark.asyncio
-async def test_handle_message_appends_to_history():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
-    mock_agent = MagicMock()
-    mock_agent.name = "claude"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="answer")))
-
-    session = _make_session(channel=channel, registry=registry)
-    gm = GatewayManager([])
-
-    msg = _make_msg(thread_id=None, content="question")
-    await gm.handle_message(session, registry, msg)
-
-    history = await session.get_history("t1")
-    assert len(history) == 2
-    assert history[0]["role"] == "user"
-    assert history[1]["role"] == "assistant"
-    assert history[1]["agent"] == "claude"
-
-
-@pytest.mark.asyncio
-async def test_owner_gate_ignores_unauthorized_user():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
-    mock_agent = MagicMock()
-    mock_agent.name = "claude"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="answer")))
-
-    session = _make_session(channel=channel, registry=registry)
-    gm = GatewayManager([], owner_user_ids={"42"})
-
-    msg = _make_msg(thread_id=None, content="question", author_id="99")
-    await gm.handle_message(session, registry, msg)
-
-    registry.run.assert_not_called()
-    channel.create_thread.assert_not_called()
-    channel.send.assert_not_called()
-
-
-@pytest.mark.asyncio
-async def test_owner_gate_allows_system_messages():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
+@pytest.mark.parametrize(
+    ("author_id", "system", "expect_run"),
+    [("99", False, False), (None, True, True)],
+    ids=["ignores_unauthorized_user", "allows_system_messages"],
+)
+async def test_owner_gate(channel, registry, gated_gm, author_id, system, expect_run):
     mock_agent = MagicMock()
     mock_agent.name = "claude"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="answer")))
+    registry.run = AsyncMock(return_value=(mock_agent, _RESP_ANSWER))
 
     session = _make_session(channel=channel, registry=registry)
-    gm = GatewayManager([], owner_user_ids={"42"})
-
-    msg = _make_msg(thread_id=None, content="scheduled", author_id=None, system=True)
-    await gm.handle_message(session, registry, msg)
-
-    registry.run.assert_called_once()
-    channel.send.assert_called()
-
-
-@pytest.mark.asyncio
-async def test_scheduler_dispatch_defaults_to_channel_id_when_thread_missing():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
-    mock_agent = MagicMock()
-    mock_agent.name = "codex"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="done")))
-
-    session = _make_session(channel=channel, registry=registry)
-    gm = GatewayManager([])
-    gm._sessions["discord:100"] = session
-
-    job = ScheduledJob(
-        name="tick",
-        platform="discord",
-        channel_id="100",
-        thread_id=None,
-        prompt="run",
-        interval_seconds=60,
-    )
-    await gm._dispatch_scheduled_job(job)
-
-    channel.create_thread.assert_not_called()
-    call_args = channel.send.call_args[0]
-    assert call_args[0] == "100"
-
 
+    msg = _make_msg(thread_id=None, content="question", author_id=author_id, system=system)
+    await gated_gm.handle_message(session, registry, msg)
+
+    if expect_run:
+        registry.run.assert_called_once()
+        channel.send.assert_called()
+    else:
+        registry.run.assert_not_called()
+        channel.create_thread.assert_not_called()
+        channel.send.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("platform", "job", "dm_channel", "expected_target"),
+    [
+        pytest.param("discord", _TICK_JOB, None, "100", id="defaults_to_channel_id_when_thread_missing"),
+        pytest.param("discord", _DM_JOB, "dm-42", "dm-42", id="dm_uses_dm_channel_id"),
+        pytest.param("telegram", _DM_JOB, None, None, id="dm_skips_when_channel_unsupported"),
+    ],
+)
 @pytest.mark.asyncio
-async def test_scheduler_dispatch_dm_uses_dm_channel_id():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.ensure_dm_channel = AsyncMock(return_value="dm-42")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
+async def test_scheduler_dispatch(platform, job, dm_channel, expected_target, registry, gm):
+    channel = _make_channel(platform=platform, thread_id=None)
+    if dm_channel is not None:
+        channel.ensure_dm_channel = AsyncMock(return_value=dm_channel)
     mock_agent = MagicMock()
     mock_agent.name = "codex"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="done")))
+    registry.run = AsyncMock(return_value=(mock_agent, _RESP_DONE))
 
     session = _make_session(channel=channel, registry=registry)
-    gm = GatewayManager([])
     gm._sessions["discord:100"] = session
 
-    job = ScheduledJob(
-        name="dm",
-        platform="discord",
-        channel_id="100",
-        delivery="dm",
-        target_user_id="42",
-        prompt="run",
-        interval_seconds=60,
-    )
     await gm._dispatch_scheduled_job(job)
 
-    channel.ensure_dm_channel.assert_called_once_with("42")
     channel.create_thread.assert_not_called()
-    call_args = channel.send.call_args[0]
-    assert call_args[0] == "dm-42"
-
-
-@pytest.mark.asyncio
-async def test_scheduler_dispatch_dm_skips_when_channel_unsupported():
-    channel = MagicMock()
-    channel.platform = "telegram"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
-    mock_agent = MagicMock()
-    mock_agent.name = "codex"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="done")))
-
-    session = _make_session(channel=channel, registry=registry)
-    gm = GatewayManager([])
-    gm._sessions["discord:100"] = session
-
-    job = ScheduledJob(
-        name="dm",
-        platform="discord",
-        channel_id="100",
-        delivery="dm",
-        target_user_id="42",
-        prompt="run",
-        interval_seconds=60,
-    )
-    await gm._dispatch_scheduled_job(job)
-
-    registry.run.assert_not_called()
-    channel.send.assert_not_called()
+    if expected_target is None:
+        registry.run.assert_not_called()
+        channel.send.assert_not_called()
+        return
+    if dm_channel is not None:
+        channel.ensure_dm_channel.assert_called_once_with("42")
+    assert channel.send.call_args[0][0] == expected_target
 
 
 @pytest.mark.asyncio
-async def test_scheduler_dispatch_runtime_passes_automation_name():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.send = AsyncMock()
-
-    registry = MagicMock(spec=AgentRegistry)
-    session = _make_session(channel=channel, registry=registry)
+async def test_scheduler_dispatch_runtime_passes_automation_name(registry):
+    session = _make_session(channel=_make_channel(thread_id=None), registry=registry)
 
     runtime = MagicMock()
     runtime.enabled = True
@@ -945,14 +776,8 @@ async def test_scheduler_dispatch_runtime_passes_automation_name():
 
 
 @pytest.mark.asyncio
-async def test_scheduler_dispatch_runtime_passes_timeout_and_max_turns():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.send = AsyncMock()
-
-    registry = MagicMock(spec=AgentRegistry)
-    session = _make_session(channel=channel, registry=registry)
+async def test_scheduler_dispatch_runtime_passes_timeout_and_max_turns(registry):
+    session = _make_session(channel=_make_channel(thread_id=None), registry=registry)
 
     runtime = MagicMock()
     runtime.enabled = True
@@ -977,41 +802,39 @@ async def test_scheduler_dispatch_runtime_passes_timeout_and_max_turns():
     assert kwargs["max_turns"] == 60
 
 
-@pytest.mark.asyncio
-async def test_handle_message_uses_short_workspace_override(tmp_path):
+@pytest.fixture
+def base_workspace(tmp_path) -> Path:
+    """Base workspace with the compat entries short workspaces link to."""
     base = tmp_path / "base-workspace"
-    base.mkdir(parents=True, exist_ok=True)
+    base.mkdir()
     (base / "AGENTS.md").write_text("# workspace agents\n", encoding="utf-8")
-    (base / ".claude").mkdir(exist_ok=True)
-    (base / ".gemini").mkdir(exist_ok=True)
-    (base / ".agents").mkdir(exist_ok=True)
+    for name in (".agents", ".claude", ".gemini"):
+        (base / name).mkdir()
+    return base
 
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
 
-    mock_agent = MagicMock()
-    mock_agent.name = "codex"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="answer")))
-
-    session = _make_session(channel=channel, registry=registry)
-    gm = GatewayManager(
+def _short_workspace_gm(tmp_path: Path, base_workspace: Path) -> GatewayManager:
+    return GatewayManager(
         [],
         short_workspace={
             "enabled": True,
             "ttl_hours": 24,
             "cleanup_interval_minutes": 1440,
             "root": str(tmp_path / "sessions"),
-            "base_workspace": str(base),
+            "base_workspace": str(base_workspace),
         },
     )
 
+
+@pytest.mark.asyncio
+async def test_handle_message_uses_short_workspace_override(tmp_path, base_workspace, channel, registry):
+    mock_agent = MagicMock()
+    mock_agent.name = "codex"
+    registry.run = AsyncMock(return_value=(mock_agent, _RESP_ANSWER))
+
+    session = _make_session(channel=channel, registry=registry)
+    gm = _short_workspace_gm(tmp_path, base_workspace)
+
     msg = _make_msg(thread_id="t1", content="hello")
     await gm.handle_message(session, registry, msg)
 
@@ -1026,32 +849,9 @@ async def test_handle_message_uses_short_workspace_override(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_short_workspace_cleanup_uses_db_ttl(tmp_path):
-    base = tmp_path / "base-workspace"
-    base.mkdir(parents=True, exist_ok=True)
-    (base / "AGENTS.md").write_text("# workspace agents\n", encoding="utf-8")
-
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
-    registry = MagicMock(spec=AgentRegistry)
+async def test_short_workspace_cleanup_uses_db_ttl(tmp_path, base_workspace, channel, registry):
     session = _make_session(channel=channel, registry=registry)
-    gm = GatewayManager(
-        [],
-        short_workspace={
-            "enabled": True,
-            "ttl_hours": 24,
-            "cleanup_interval_minutes": 1440,
-            "root": str(tmp_path / "sessions"),
-            "base_workspace": str(base),
-        },
-    )
+    gm = _short_workspace_gm(tmp_path, base_workspace)
 
     store = SQLiteMemoryStore(tmp_path / "memory.db")
     await store.init()
@@ -1060,13 +860,10 @@ async def test_short_workspace_cleanup_uses_db_ttl(tmp_path):
     ws = await gm._resolve_short_workspace(session, "t-clean")
     assert ws is not None and ws.exists()
 
-    db = await store._conn()  # noqa: SLF001
-    await db.execute(
-        "UPDATE ephemeral_workspaces SET last_used_at='2000-01-01 00:00:00' "
-        "WHERE workspace_key=?",
-        (gm._short_workspace_key("discord", "100", "t-clean"),),
+    await store.touch_ephemeral_workspace(
+        gm._short_workspace_key("discord", "100", "t-clean"),
+        last_used_at="2000-01-01 00:00:00",
     )
-    await db.commit()
 
     cleaned = await gm._cleanup_expired_short_workspaces()
     assert cleaned == 1
@@ -1075,14 +872,9 @@ async def test_short_workspace_cleanup_uses_db_ttl(tmp_path):
     await store.close()
 
 
-def test_prepare_workspace_compat_files_replaces_stale_entries(tmp_path):
-    base = tmp_path / "base-workspace"
-    base.mkdir(parents=True, exist_ok=True)
-    (base / "AGENTS.md").write_text("# fresh agents\n", encoding="utf-8")
-    (base / ".agents").mkdir(exist_ok=True)
-    (base / ".agents" / "skills").mkdir(parents=True, exist_ok=True)
-    (base / ".claude").mkdir(exist_ok=True)
-    (base / ".gemini").mkdir(exist_ok=True)
+def test_prepare_workspace_compat_files_replaces_stale_entries(tmp_path, base_workspace):
+    base = base_workspace
+    (base / ".agents" / "skills").mkdir()
 
     session_ws = tmp_path / "sessions" / "thread-1"
     session_ws.mkdir(parents=True, exist_ok=True)
@@ -1138,38 +930,30 @@ async def test_resolve_short_workspace_refreshes_stale_base_workspace(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_router_propose_task_creates_runtime_draft_and_skips_reply():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
+async def test_router_propose_task_creates_runtime_draft_and_skips_reply(channel, registry):
     mock_agent = MagicMock()
     mock_agent.name = "codex"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="answer")))
+    registry.run = AsyncMock(return_value=(mock_agent, _RESP_ANSWER))
 
-    runtime = MagicMock()
-    runtime.maybe_handle_thread_context = AsyncMock(return_value=False)
-    runtime.maybe_handle_incoming = AsyncMock(return_value=False)
-    runtime.create_repo_change_task = AsyncMock()
+    runtime = SimpleNamespace(
+        maybe_handle_thread_context=_async_returning(False),
+        maybe_handle_incoming=_async_returning(False),
+        create_repo_change_task=AsyncMock(),
+    )
 
-    router = MagicMock()
-    router.confidence_threshold = 0.55
-    router.route = AsyncMock(
-        return_value=RouteDecision(
-            decision="propose_repo_change",
-            confidence=0.91,
-            goal="create a new skill and validate it",
-            risk_hints=[],
-            raw_text="{}",
-            task_type="repo_change",
-            completion_mode="merge",
-        )
+    router = SimpleNamespace(
+        confidence_threshold=0.55,
+        route=AsyncMock(
+            return_value=RouteDecision(
+                decision="propose_repo_change",
+                confidence=0.91,
+                goal="create a new skill and validate it",
+                risk_hints=[],
+                raw_text="{}",
+                task_type="repo_change",
+                completion_mode="merge",
+            )
+        ),
     )
 
     session = _make_session(channel=channel, registry=registry)
@@ -1186,43 +970,35 @@ async def test_router_propose_task_creates_runtime_draft_and_skips_reply():
 
 
 @pytest.mark.asyncio
-async def test_router_propose_artifact_task_creates_artifact_runtime_draft():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
+async def test_router_propose_artifact_task_creates_artifact_runtime_draft(channel, registry):
     mock_agent = MagicMock()
     mock_agent.name = "codex"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="answer")))
+    registry.run = AsyncMock(return_value=(mock_agent, _RESP_ANSWER))
 
-    runtime = MagicMock()
-    runtime.maybe_handle_thread_context = AsyncMock(return_value=False)
-    runtime.maybe_handle_incoming = AsyncMock(return_value=False)
-    runtime.create_artifact_task = AsyncMock()
+    runtime = SimpleNamespace(
+        maybe_handle_thread_context=_async_returning(False),
+        maybe_handle_incoming=_async_returning(False),
+        create_artifact_task=AsyncMock(),
+    )
 
-    router = MagicMock()
-    router.confidence_threshold = 0.55
     # Router emits ``force_draft=True`` for this prompt — legacy
     # ``oneoff_artifact`` no longer carries an implicit DRAFT default;
     # the router (or "draft:" prefix) must opt in. See the v2 router
     # system prompt for the heuristics that trigger ``force_draft``.
-    router.route = AsyncMock(
-        return_value=RouteDecision(
-            decision="oneoff_artifact",  # normalized to v2 ``artifact`` by __post_init__
-            confidence=0.91,
-            goal="Generate a markdown daily news brief",
-            risk_hints=[],
-            raw_text="{}",
-            task_type="artifact",
-            completion_mode="reply",
-            force_draft=True,
-        )
+    router = SimpleNamespace(
+        confidence_threshold=0.55,
+        route=AsyncMock(
+            return_value=RouteDecision(
+                decision="oneoff_artifact",  # normalized to v2 ``artifact`` by __post_init__
+                confidence=0.91,
+                goal="Generate a markdown daily news brief",
+                risk_hints=[],
+                raw_text="{}",
+                task_type="artifact",
+                completion_mode="reply",
+                force_draft=True,
+            )
+        ),
     )
 
     session = _make_session(channel=channel, registry=registry)
@@ -1239,44 +1015,33 @@ async def test_router_propose_artifact_task_creates_artifact_runtime_draft():
 
 
 @pytest.mark.asyncio
-async def test_explicit_skill_invocation_creates_artifact_task(tmp_path):
+async def test_explicit_skill_invocation_creates_artifact_task(tmp_path, channel, registry):
     """PR2.1: explicit ``/skill_name`` is now treated as a runtime
     artifact task (skill paths unification). It bypasses the router but
     NOT the runtime — the call lands on
     ``RuntimeService.create_artifact_task`` with ``skill_name``,
     ``source='explicit_skill'``, and ``auto_approve=True`` (the user
     invoked the skill explicitly, no second-step approval needed)."""
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
 
     mock_agent = MagicMock()
     mock_agent.name = "claude"
-    registry = MagicMock(spec=AgentRegistry)
     registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="news reply")))
 
-    runtime = MagicMock()
-    runtime.maybe_handle_thread_context = AsyncMock(return_value=False)
-    runtime.maybe_handle_incoming = AsyncMock(return_value=False)
-    runtime.create_task = AsyncMock()
-    runtime.create_skill_task = AsyncMock()
-    runtime.create_artifact_task = AsyncMock()
+    runtime = SimpleNamespace(
+        maybe_handle_thread_context=_async_returning(False),
+        maybe_handle_incoming=_async_returning(False),
+        create_task=AsyncMock(),
+        create_skill_task=AsyncMock(),
+        create_artifact_task=AsyncMock(),
+    )
 
-    router = MagicMock()
-    router.confidence_threshold = 0.55
-    router.route = AsyncMock()
+    router = SimpleNamespace(confidence_threshold=0.55, route=AsyncMock())
 
     skills_root = tmp_path / "skills"
     skill_dir = skills_root / "top-5-daily-news"
     skill_dir.mkdir(parents=True)
     (skill_dir / "SKILL.md").write_text("name: top-5-daily-news\n", encoding="utf-8")
-    syncer = MagicMock()
-    syncer._skills_path = skills_root  # noqa: SLF001
+    syncer = SimpleNamespace(_skills_path=skills_root)
 
     session = _make_session(channel=channel, registry=registry)
     gm = GatewayManager(
@@ -1295,7 +1060,7 @@ async def test_explicit_skill_invocation_creates_artifact_task(tmp_path):
     registry.run.assert_not_called()
     runtime.create_skill_task.assert_not_called()
     runtime.create_task.assert_not_called()
-    runtime.maybe_handle_incoming.assert_not_called()
+    assert runtime.maybe_handle_incoming.calls == []
 
     # Hand-off lands on create_artifact_task with the right knobs.
     runtime.create_artifact_task.assert_awaited_once()
@@ -1307,29 +1072,20 @@ async def test_explicit_skill_invocation_creates_artifact_task(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_explicit_skill_invocation_forwards_skill_timeout_to_task(tmp_path):
+async def test_explicit_skill_invocation_forwards_skill_timeout_to_task(tmp_path, channel, registry):
     """SKILL.md ``metadata.timeout_seconds`` / ``max_turns`` used to apply
     only to the inline ``AgentRegistry.run`` path; with PR2.1's task-
     routing the manager forwards them as ``agent_timeout_seconds`` /
     ``agent_max_turns`` to ``create_artifact_task`` so a long-running
     skill like ``market-briefing-ai`` (1500s) keeps its budget."""
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
 
     mock_agent = MagicMock()
     mock_agent.name = "gemini"
-    registry = MagicMock(spec=AgentRegistry)
     registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="report")))
 
     runtime = MagicMock()
-    runtime.maybe_handle_thread_context = AsyncMock(return_value=False)
-    runtime.maybe_handle_incoming = AsyncMock(return_value=False)
+    runtime.maybe_handle_thread_context = _async_returning(False)
+    runtime.maybe_handle_incoming = _async_returning(False)
     runtime.create_task = AsyncMock()
     runtime.create_skill_task = AsyncMock()
     runtime.create_artifact_task = AsyncMock()
@@ -1375,22 +1131,12 @@ async def test_explicit_skill_invocation_forwards_skill_timeout_to_task(tmp_path
 
 
 @pytest.mark.asyncio
-async def test_router_repair_skill_creates_skill_task_with_thread_context(tmp_path):
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
-    registry = MagicMock(spec=AgentRegistry)
+async def test_router_repair_skill_creates_skill_task_with_thread_context(tmp_path, channel, registry):
     registry.run = AsyncMock()
 
     runtime = MagicMock()
-    runtime.maybe_handle_thread_context = AsyncMock(return_value=False)
-    runtime.maybe_handle_incoming = AsyncMock(return_value=False)
+    runtime.maybe_handle_thread_context = _async_returning(False)
+    runtime.maybe_handle_incoming = _async_returning(False)
     runtime.create_skill_task = AsyncMock()
 
     router = MagicMock()
@@ -1439,29 +1185,20 @@ async def test_router_repair_skill_creates_skill_task_with_thread_context(tmp_pa
 
 
 @pytest.mark.asyncio
-async def test_router_invoke_skill_creates_artifact_task_when_skill_name_resolved(tmp_path):
+async def test_router_invoke_skill_creates_artifact_task_when_skill_name_resolved(tmp_path, channel, registry):
     """PR2.1: when the router emits ``invoke_skill`` AND ``skill_name``
     matches a registered skill, the manager dispatches to
     ``RuntimeService.create_artifact_task`` (no inline AgentRegistry.run).
     Mirrors the explicit-``/skill_name`` flow."""
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
 
     mock_agent = MagicMock()
     mock_agent.name = "claude"
-    registry = MagicMock(spec=AgentRegistry)
     registry.agents = [mock_agent]
     registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="should not fire")))
 
     runtime = MagicMock()
-    runtime.maybe_handle_thread_context = AsyncMock(return_value=False)
-    runtime.maybe_handle_incoming = AsyncMock(return_value=False)
+    runtime.maybe_handle_thread_context = _async_returning(False)
+    runtime.maybe_handle_incoming = _async_returning(False)
     runtime.create_artifact_task = AsyncMock()
 
     router = MagicMock()
@@ -1504,25 +1241,15 @@ async def test_router_invoke_skill_creates_artifact_task_when_skill_name_resolve
 
 
 @pytest.mark.asyncio
-async def test_router_invoke_existing_skill_uses_recent_merged_skill_context(tmp_path):
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
+async def test_router_invoke_existing_skill_uses_recent_merged_skill_context(tmp_path, channel, registry):
     mock_agent = MagicMock()
     mock_agent.name = "codex"
-    registry = MagicMock(spec=AgentRegistry)
     registry.agents = [mock_agent]
     registry.run = AsyncMock(return_value=(mock_agent, AgentResponse(text="analysis ready")))
 
     runtime = MagicMock()
-    runtime.maybe_handle_thread_context = AsyncMock(return_value=False)
-    runtime.maybe_handle_incoming = AsyncMock(return_value=False)
+    runtime.maybe_handle_thread_context = _async_returning(False)
+    runtime.maybe_handle_incoming = _async_returning(False)
 
     router = MagicMock()
     router.confidence_threshold = 0.55
@@ -1639,28 +1366,17 @@ async def test_gateway_stop_rejects_new_messages():
 
 
 @pytest.mark.asyncio
-async def test_gateway_stop_waits_for_inflight_messages():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock()
-    channel.send = AsyncMock()
-    channel.stop = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
+async def test_gateway_stop_waits_for_inflight_messages(channel, registry):
     started = asyncio.Event()
     release = asyncio.Event()
     mock_agent = MagicMock()
     mock_agent.name = "claude"
-    registry = MagicMock(spec=AgentRegistry)
     registry.agents = [mock_agent]
 
     async def _run(*args, **kwargs):
         started.set()
         await release.wait()
-        return mock_agent, AgentResponse(text="reply")
+        return mock_agent, _RESP_REPLY
 
     registry.run = AsyncMock(side_effect=_run)
     session = _make_session(channel=channel, registry=registry)
@@ -1677,126 +1393,66 @@ async def test_gateway_stop_waits_for_inflight_messages():
 
     release.set()
     await asyncio.gather(message_task, stop_task)
-    channel.stop.assert_awaited_once()
+    assert len(channel.stop.calls) == 1
 
 
 @pytest.mark.asyncio
-async def test_handle_message_hides_agent_error_text():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock()
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
-    mock_agent = MagicMock()
-    mock_agent.name = "claude"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.agents = [mock_agent]
-    registry.run = AsyncMock(
-        return_value=(mock_agent, AgentResponse(text="", error="secret stack", error_kind="cli_error"))
-    )
+async def test_handle_message_hides_agent_error_text(ctx):
+    ctx.respond(AgentResponse(text="", error="secret stack", error_kind="cli_error"))
 
-    session = _make_session(channel=channel, registry=registry)
-    gm = GatewayManager([])
-
-    await gm.handle_message(session, registry, _make_msg(thread_id="thread-1", content="trigger"))
+    await ctx.send(thread_id="thread-1", content="trigger")
 
-    channel.send.assert_awaited_once_with("thread-1", USER_MSG_AGENT_CRASH)
+    ctx.channel.send.assert_awaited_once_with("thread-1", USER_MSG_AGENT_CRASH)
 
 
 @pytest.mark.asyncio
-async def test_handle_message_surfaces_partial_excerpt_for_max_turns():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock()
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-
-    mock_agent = MagicMock()
-    mock_agent.name = "claude"
-    registry = MagicMock(spec=AgentRegistry)
-    registry.agents = [mock_agent]
-    registry.run = AsyncMock(
-        return_value=(
-            mock_agent,
-            AgentResponse(
-                text="",
-                error="budget hit",
-                error_kind="max_turns",
-                partial_text="partial answer",
-            ),
+async def test_handle_message_surfaces_partial_excerpt_for_max_turns(ctx):
+    ctx.respond(
+        AgentResponse(
+            text="",
+            error="budget hit",
+            error_kind="max_turns",
+            partial_text="partial answer",
         )
     )
 
-    session = _make_session(channel=channel, registry=registry)
-    gm = GatewayManager([])
-
-    await gm.handle_message(session, registry, _make_msg(thread_id="thread-1", content="trigger"))
+    await ctx.send(thread_id="thread-1", content="trigger")
 
-    sent = channel.send.await_args.args[1]
+    sent = ctx.channel.send.await_args.args[1]
     assert "max turn budget" in sent
     assert "partial answer" in sent
 
 
 @pytest.mark.asyncio
-async def test_handle_message_maps_storage_error_to_user_safe_message():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock()
-    channel.send = AsyncMock()
-
-    session = _make_session(channel=channel)
-    session.get_history = AsyncMock(side_effect=sqlite3.OperationalError("db exploded"))
-    gm = GatewayManager([])
-
-    await gm.handle_message(session, session.registry, _make_msg(thread_id="thread-1", content="trigger"))
-
-    channel.send.assert_awaited_once_with("thread-1", USER_MSG_STORE_FAILURE)
-
-
-@pytest.mark.asyncio
-async def test_handle_message_maps_unexpected_error_to_internal_message():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock()
-    channel.send = AsyncMock()
-
+@pytest.mark.parametrize(
+    ("exc", "expected"),
+    [
+        (sqlite3.OperationalError("db exploded"), USER_MSG_STORE_FAILURE),
+        (RuntimeError("sensitive detail"), USER_MSG_INTERNAL),
+    ],
+    ids=["storage_error", "unexpected_error"],
+)
+async def test_handle_message_maps_internal_errors_to_user_safe_messages(gm, exc, expected):
+    channel = _make_channel()
     session = _make_session(channel=channel)
-    session.get_history = AsyncMock(side_effect=RuntimeError("sensitive detail"))
-    gm = GatewayManager([])
+    session.get_history = AsyncMock(side_effect=exc)
 
     await gm.handle_message(session, session.registry, _make_msg(thread_id="thread-1", content="trigger"))
 
-    channel.send.assert_awaited_once_with("thread-1", USER_MSG_INTERNAL)
+    channel.send.assert_awaited_once_with("thread-1", expected)
 
 
 # ── Router borderline / autonomy-threshold behavior ─────────────────── #
 
 
 def _make_router_border_channel():
-    channel = MagicMock()
-    channel.platform = "discord"
-    channel.channel_id = "100"
-    channel.create_thread = AsyncMock(return_value="t1")
-    channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
-    return channel
+    return _make_channel(thread_id="t1")
 
 
 def _make_router_border_runtime():
     runtime = MagicMock()
-    runtime.maybe_handle_thread_context = AsyncMock(return_value=False)
-    runtime.maybe_handle_incoming = AsyncMock(return_value=False)
+    runtime.maybe_handle_thread_context = _async_returning(False)
+    runtime.maybe_handle_incoming = _async_returning(False)
     runtime.create_skill_task = AsyncMock()
     return runtime
 
@@ -1828,9 +1484,8 @@ def _last_send_text(channel) -> str:
 
 
 @pytest.mark.asyncio
-async def test_router_create_skill_borderline_forces_draft_and_confirm_text():
+async def test_router_create_skill_borderline_forces_draft_and_confirm_text(registry):
     channel = _make_router_border_channel()
-    registry = MagicMock(spec=AgentRegistry)
     registry.run = AsyncMock()
     runtime = _make_router_border_runtime()
     router = _make_router_stub(decision="update_skill", confidence=0.70, skill_name="skill-x")
@@ -1855,7 +1510,7 @@ async def test_router_create_skill_borderline_forces_draft_and_confirm_text():
 
 
 @pytest.mark.asyncio
-async def test_router_create_skill_high_confidence_drafts_in_v2():
+async def test_router_create_skill_high_confidence_drafts_in_v2(registry):
     """v2 doctrine: ``repo_update`` (which absorbs the legacy
     ``update_skill``) always drafts, regardless of router confidence.
     The legacy v1 ``is_borderline``-bypass auto-run path was removed
@@ -1863,7 +1518,6 @@ async def test_router_create_skill_high_confidence_drafts_in_v2():
     affects the confirmation message wording but NOT the force_draft
     flag — that's hardcoded True for all repo_update paths."""
     channel = _make_router_border_channel()
-    registry = MagicMock(spec=AgentRegistry)
     registry.run = AsyncMock()
     runtime = _make_router_border_runtime()
     router = _make_router_stub(decision="update_skill", confidence=0.95, skill_name="skill-y")
@@ -1890,9 +1544,8 @@ async def test_router_create_skill_high_confidence_drafts_in_v2():
 
 
 @pytest.mark.asyncio
-async def test_router_repair_skill_borderline_forces_draft_and_confirm_text(tmp_path):
+async def test_router_repair_skill_borderline_forces_draft_and_confirm_text(tmp_path, registry):
     channel = _make_router_border_channel()
-    registry = MagicMock(spec=AgentRegistry)
     registry.run = AsyncMock()
     runtime = _make_router_border_runtime()
     router = _make_router_stub(decision="update_skill", confidence=0.70, skill_name="paper-digest")
@@ -1926,13 +1579,12 @@ async def test_router_repair_skill_borderline_forces_draft_and_confirm_text(tmp_
 
 
 @pytest.mark.asyncio
-async def test_router_repair_skill_high_confidence_drafts_in_v2(tmp_path):
+async def test_router_repair_skill_high_confidence_drafts_in_v2(tmp_path, registry):
     """v2 doctrine: ``repo_update`` skill repair always drafts, even at
     high router confidence. The legacy v1 auto-run path for high-confidence
     skill repair was removed in WS A's Codex round-1 BLOCK-fix because
     repo-modifying tasks must always require explicit user approval."""
     channel = _make_router_border_channel()
-    registry = MagicMock(spec=AgentRegistry)
     registry.run = AsyncMock()
     runtime = _make_router_border_runtime()
     router = _make_router_stub(decision="update_skill", confidence=0.95, skill_name="paper-digest")
@@ -1969,9 +1621,8 @@ async def test_router_repair_skill_high_confidence_drafts_in_v2(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_shutdown_event_wakes_short_workspace_janitor(tmp_path):
+async def test_shutdown_event_wakes_short_workspace_janitor(tmp_path, gm):
     """Setting _shutdown_event lets the janitor exit cooperatively, no cancel."""
-    gm = GatewayManager([])
     gm._short_workspace_enabled = True
     gm._short_workspace_root = tmp_path / "ws"
     gm._short_workspace_root.mkdir(parents=True, exist_ok=True)
@@ -16,6 +16,7 @@ from oh_my_agent.agents.registry import AgentRegistry
 from oh_my_agent.gateway.base import IncomingMessage
 from oh_my_agent.gateway.manager import GatewayManager
 from oh_my_agent.gateway.session import ChannelSession
+from tests.conftest import noop_typing
 
 
 def _msg(thread_id="t1", content="hi") -> IncomingMessage:
@@ -54,14 +55,7 @@ class _FakeChannel:
         return "t1"
 
     def typing(self, thread_id: str):
-        class _Ctx:
-            async def __aenter__(self_inner):
-                return None
-
-            async def __aexit__(self_inner, *exc):
-                return False
-
-        return _Ctx()
+        return noop_typing(thread_id)
 
     async def stop(self) -> None:
         return None
@@ -11,6 +11,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 
 from oh_my_agent import paths
 
@@ -244,7 +245,7 @@ def test_runtime_reports_dir_returns_absolute_when_set() -> None:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def _runtime_for_sentinel(tmp_path: Path):
     """Construct a minimal RuntimeService for path-attribute inspection.
 
@@ -287,6 +288,7 @@ async def _runtime_for_sentinel(tmp_path: Path):
     await store.close()
 
 
+@pytest.mark.asyncio
 async def test_drift_sentinel_six_path_attributes(_runtime_for_sentinel, tmp_path: Path) -> None:
     """Pin all 6 RuntimeService path attributes to their paths.py counterparts.
 
@@ -312,6 +314,7 @@ async def test_drift_sentinel_six_path_attributes(_runtime_for_sentinel, tmp_pat
     assert rt._agent_logs_root == rt._logs_root / "agents"
 
 
+@pytest.mark.asyncio
 @pytest.mark.parametrize("reports_value", [None, False, "", "DEFAULT_OMITTED"])
 async def test_drift_sentinel_reports_dir_all_four_cases(
     _runtime_for_sentinel, reports_value
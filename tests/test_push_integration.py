@@ -17,6 +17,7 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 
 from oh_my_agent.gateway.session import ChannelSession
 from oh_my_agent.memory.store import SQLiteMemoryStore
@@ -79,7 +80,7 @@ def _make_session() -> ChannelSession:
     )
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def store(tmp_path):
     s = SQLiteMemoryStore(tmp_path / "notif.db")
     await s.init()
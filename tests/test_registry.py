@@ -97,38 +97,33 @@ def test_registry_requires_at_least_one_agent():
         AgentRegistry([])
 
 
-@pytest.mark.asyncio
-async def test_returns_first_successful_agent():
-    a = _OKAgent("a", "result-a")
-    b = _OKAgent("b", "result-b")
-    registry = AgentRegistry([a, b])
-    agent, resp = await registry.run("hello")
-    assert agent is a
-    assert resp.text == "result-a"
-    assert len(a.calls) == 1
-    assert len(b.calls) == 0  # never tried
-
-
-@pytest.mark.asyncio
-async def test_falls_back_to_second_agent_on_first_failure():
-    fail = _FailAgent("fail")
-    ok = _OKAgent("ok", "success")
-    registry = AgentRegistry([fail, ok])
-    agent, resp = await registry.run("hello")
-    assert agent is ok
-    assert resp.text == "success"
-    assert len(fail.calls) == 1
-    assert len(ok.calls) == 1
+def _agent(kind: str, name: str) -> BaseAgent:
+    if kind == "ok":
+        return _OKAgent(name, f"result-{name}")
+    return _FailAgent(name, f"error-{name}")
 
 
 @pytest.mark.asyncio
-async def test_returns_last_error_when_all_fail():
-    a = _FailAgent("a", "error-a")
-    b = _FailAgent("b", "error-b")
-    registry = AgentRegistry([a, b])
+@pytest.mark.parametrize(
+    ("kinds", "winner_idx", "expected_text", "expected_error", "expected_calls"),
+    [
+        # First success wins; the second agent is never tried.
+        (("ok", "ok"), 0, "result-a", None, [1, 0]),
+        # Falls back to the second agent on the first failure.
+        (("fail", "ok"), 1, "result-b", None, [1, 1]),
+        # All fail: the last agent's error is returned.
+        (("fail", "fail"), 1, "", "error-b", [1, 1]),
+    ],
+    ids=["first_success", "fallback", "all_fail"],
+)
+async def test_registry_fallback(kinds, winner_idx, expected_text, expected_error, expected_calls):
+    agents = [_agent(kind, name) for kind, name in zip(kinds, ("a", "b"))]
+    registry = AgentRegistry(agents)
     agent, resp = await registry.run("hello")
-    assert agent is b
-    assert resp.error == "error-b"
+    assert agent is agents[winner_idx]
+    assert resp.text == expected_text
+    assert resp.error == expected_error
+    assert [len(a.calls) for a in agents] == expected_calls
 
 
 @pytest.mark.asyncio
@@ -1,8 +1,24 @@
 import pytest
 
+from oh_my_agent.gateway import router as router_module
 from oh_my_agent.gateway.router import OpenAICompatibleRouter, normalize_intent
 
 
+def _make_router(**overrides) -> OpenAICompatibleRouter:
+    kwargs = {"base_url": "https://api.example.com/v1", "api_key": "k", "model": "m"}
+    kwargs.update(overrides)
+    return OpenAICompatibleRouter(**kwargs)
+
+
+def _completion(content: str) -> dict:
+    """Chat-completion response body as ``_post_json`` returns it."""
+    return {"choices": [{"message": {"content": content}}]}
+
+
+# Shared by the prompt-inspection tests, which only care about the request.
+_CHAT_REPLY_COMPLETION = _completion('{"decision":"chat_reply","confidence":0.9,"goal":"","risk_hints":[]}')
+
+
 def test_normalize_intent_passes_through_canonical_names():
     """All three v2 canonical intents must round-trip identical."""
     for canonical in ("reply", "artifact", "repo_update"):
@@ -52,28 +68,14 @@ def test_normalize_intent_unknown_falls_back_to_reply():
 
 @pytest.mark.asyncio
 async def test_router_parses_valid_json_decision(monkeypatch):
-    router = OpenAICompatibleRouter(
-        base_url="https://api.example.com/v1",
-        api_key="k",
-        model="m",
-        timeout_seconds=3,
-        confidence_threshold=0.55,
-    )
+    router = _make_router(timeout_seconds=3, confidence_threshold=0.55)
 
     def _fake_post(_payload):
-        return {
-            "choices": [
-                {
-                    "message": {
-                        "content": (
-                            '{"decision":"propose_repo_change","confidence":0.88,'
-                            '"goal":"fix tests and docs","risk_hints":["multi-step"],'
-                            '"task_type":"repo_change","completion_mode":"merge"}'
-                        )
-                    }
-                }
-            ]
-        }
+        return _completion(
+            '{"decision":"propose_repo_change","confidence":0.88,'
+            '"goal":"fix tests and docs","risk_hints":["multi-step"],'
+            '"task_type":"repo_change","completion_mode":"merge"}'
+        )
 
     monkeypatch.setattr(router, "_post_json", _fake_post)
     out = await router.route("please fix and run tests")
@@ -92,25 +94,13 @@ async def test_router_parses_valid_json_decision(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_router_extracts_json_from_wrapped_text(monkeypatch):
-    router = OpenAICompatibleRouter(
-        base_url="https://api.example.com/v1",
-        api_key="k",
-        model="m",
-    )
+    router = _make_router()
 
     def _fake_post(_payload):
-        return {
-            "choices": [
-                {
-                    "message": {
-                        "content": (
-                            "Here is result:\\n"
-                            '{"decision":"chat_reply","confidence":0.74,"goal":"","risk_hints":[]}'
-                        )
-                    }
-                }
-            ]
-        }
+        return _completion(
+            "Here is result:\\n"
+            '{"decision":"chat_reply","confidence":0.74,"goal":"","risk_hints":[]}'
+        )
 
     monkeypatch.setattr(router, "_post_json", _fake_post)
     out = await router.route("hi")
@@ -123,33 +113,20 @@ async def test_router_extracts_json_from_wrapped_text(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_router_retries_once_then_succeeds(monkeypatch):
-    router = OpenAICompatibleRouter(
-        base_url="https://api.example.com/v1",
-        api_key="k",
-        model="m",
-        timeout_seconds=1,
-        max_retries=1,
-    )
+    router = _make_router(timeout_seconds=1, max_retries=1)
     calls = {"n": 0}
 
     def _fake_post(_payload):
         calls["n"] += 1
         if calls["n"] == 1:
             raise RuntimeError("timeout")
-        return {
-            "choices": [
-                {
-                    "message": {
-                        "content": (
-                            '{"decision":"propose_repo_change","confidence":0.66,"goal":"do x",'
-                            '"risk_hints":[],"task_type":"repo_change","completion_mode":"merge"}'
-                        )
-                    }
-                }
-            ]
-        }
+        return _completion(
+            '{"decision":"propose_repo_change","confidence":0.66,"goal":"do x",'
+            '"risk_hints":[],"task_type":"repo_change","completion_mode":"merge"}'
+        )
 
     monkeypatch.setattr(router, "_post_json", _fake_post)
+    monkeypatch.setattr(router_module, "_RETRY_BACKOFF_SECONDS", 0.0)
     out = await router.route("please do x")
     assert calls["n"] == 2
     assert out is not None
@@ -160,27 +137,15 @@ async def test_router_retries_once_then_succeeds(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_router_parses_create_skill_decision(monkeypatch):
-    router = OpenAICompatibleRouter(
-        base_url="https://api.example.com/v1",
-        api_key="k",
-        model="m",
-    )
+    router = _make_router()
 
     def _fake_post(_payload):
-        return {
-            "choices": [
-                {
-                    "message": {
-                        "content": (
-                            '{"decision":"create_skill","confidence":0.91,'
-                            '"goal":"Create a reusable weather skill",'
-                            '"skill_name":"weather",'
-                            '"risk_hints":["reusable"]}'
-                        )
-                    }
-                }
-            ]
-        }
+        return _completion(
+            '{"decision":"create_skill","confidence":0.91,'
+            '"goal":"Create a reusable weather skill",'
+            '"skill_name":"weather",'
+            '"risk_hints":["reusable"]}'
+        )
 
     monkeypatch.setattr(router, "_post_json", _fake_post)
     out = await router.route("create a skill for checking weather")
@@ -194,27 +159,15 @@ async def test_router_parses_create_skill_decision(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_router_parses_artifact_task_decision(monkeypatch):
-    router = OpenAICompatibleRouter(
-        base_url="https://api.example.com/v1",
-        api_key="k",
-        model="m",
-    )
+    router = _make_router()
 
     def _fake_post(_payload):
-        return {
-            "choices": [
-                {
-                    "message": {
-                        "content": (
-                            '{"decision":"oneoff_artifact","confidence":0.83,'
-                            '"goal":"Generate a daily news markdown report",'
-                            '"risk_hints":["multi_step"],'
-                            '"task_type":"artifact","completion_mode":"reply"}'
-                        )
-                    }
-                }
-            ]
-        }
+        return _completion(
+            '{"decision":"oneoff_artifact","confidence":0.83,'
+            '"goal":"Generate a daily news markdown report",'
+            '"risk_hints":["multi_step"],'
+            '"task_type":"artifact","completion_mode":"reply"}'
+        )
 
     monkeypatch.setattr(router, "_post_json", _fake_post)
     out = await router.route("生成一份今日新闻速读并整理成 markdown")
@@ -227,24 +180,12 @@ async def test_router_parses_artifact_task_decision(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_router_prompt_carries_disambiguation_and_examples(monkeypatch):
-    router = OpenAICompatibleRouter(
-        base_url="https://api.example.com/v1",
-        api_key="k",
-        model="m",
-    )
+    router = _make_router()
     captured: dict = {}
 
     def _spy_post(payload):
         captured["payload"] = payload
-        return {
-            "choices": [
-                {
-                    "message": {
-                        "content": '{"decision":"chat_reply","confidence":0.9,"goal":"","risk_hints":[]}'
-                    }
-                }
-            ]
-        }
+        return _CHAT_REPLY_COMPLETION
 
     monkeypatch.setattr(router, "_post_json", _spy_post)
     await router.route("hi")
@@ -263,9 +204,7 @@ async def test_router_prompt_carries_disambiguation_and_examples(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_router_extra_body_cannot_override_reserved_keys(monkeypatch):
-    router = OpenAICompatibleRouter(
-        base_url="https://api.example.com/v1",
-        api_key="k",
+    router = _make_router(
         model="safe-model",
         extra_body={
             "model": "evil-model",
@@ -279,15 +218,7 @@ async def test_router_extra_body_cannot_override_reserved_keys(monkeypatch):
 
     def _spy_post(payload):
         captured["payload"] = payload
-        return {
-            "choices": [
-                {
-                    "message": {
-                        "content": '{"decision":"chat_reply","confidence":0.9,"goal":"","risk_hints":[]}'
-                    }
-                }
-            ]
-        }
+        return _CHAT_REPLY_COMPLETION
 
     monkeypatch.setattr(router, "_post_json", _spy_post)
     await router.route("hi")
@@ -306,28 +237,16 @@ async def test_router_extra_body_cannot_override_reserved_keys(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_router_parses_repair_skill_decision(monkeypatch):
-    router = OpenAICompatibleRouter(
-        base_url="https://api.example.com/v1",
-        api_key="k",
-        model="m",
-    )
+    router = _make_router()
 
     def _fake_post(_payload):
-        return {
-            "choices": [
-                {
-                    "message": {
-                        "content": (
-                            '{"decision":"repair_skill","confidence":0.89,'
-                            "\"goal\":\"Update existing skill 'top-5-daily-news' based on recent feedback\","
-                            '"skill_name":"top-5-daily-news",'
-                            '"risk_hints":["quality_feedback"],'
-                            '"task_type":"skill_change","completion_mode":"merge"}'
-                        )
-                    }
-                }
-            ]
-        }
+        return _completion(
+            '{"decision":"repair_skill","confidence":0.89,'
+            "\"goal\":\"Update existing skill 'top-5-daily-news' based on recent feedback\","
+            '"skill_name":"top-5-daily-news",'
+            '"risk_hints":["quality_feedback"],'
+            '"task_type":"skill_change","completion_mode":"merge"}'
+        )
 
     monkeypatch.setattr(router, "_post_json", _fake_post)
     out = await router.route(
@@ -357,11 +276,7 @@ async def test_router_parses_repair_skill_decision(monkeypatch):
 async def test_router_recovers_truncated_json_pretty_printed(monkeypatch):
     """Real DeepSeek V4 flash failure mode: output cut off after a partial
     string value. Recovery should still surface the leading complete pairs."""
-    router = OpenAICompatibleRouter(
-        base_url="https://api.example.com/v1",
-        api_key="k",
-        model="deepseek-v4-flash",
-    )
+    router = _make_router(model="deepseek-v4-flash")
 
     truncated = (
         '{\n'
@@ -372,7 +287,7 @@ async def test_router_recovers_truncated_json_pretty_printed(monkeypatch):
     )
 
     def _fake_post(_payload):
-        return {"choices": [{"message": {"content": truncated}}]}
+        return _completion(truncated)
 
     monkeypatch.setattr(router, "_post_json", _fake_post)
     out = await router.route("飞书文档怎么接入比较方便？")
@@ -393,11 +308,7 @@ async def test_router_recovers_truncated_json_pretty_printed(monkeypatch):
 async def test_router_recovers_truncated_json_after_complete_pair(monkeypatch):
     """When the model dies right after a comma, the safe-prefix strategy
     picks up the complete pairs to the left."""
-    router = OpenAICompatibleRouter(
-        base_url="https://api.example.com/v1",
-        api_key="k",
-        model="deepseek-v4-flash",
-    )
+    router = _make_router(model="deepseek-v4-flash")
 
     truncated = (
         '{"decision":"oneoff_artifact","confidence":0.8,'
@@ -406,7 +317,7 @@ async def test_router_recovers_truncated_json_after_complete_pair(monkeypatch):
     )
 
     def _fake_post(_payload):
-        return {"choices": [{"message": {"content": truncated}}]}
+        return _completion(truncated)
 
     monkeypatch.setattr(router, "_post_json", _fake_post)
     out = await router.route("生成一份今日新闻速读")
@@ -421,11 +332,7 @@ async def test_router_recovers_truncated_json_after_complete_pair(monkeypatch):
 @pytest.mark.asyncio
 async def test_router_strips_markdown_code_fences(monkeypatch):
     """Some models still wrap JSON in ```json … ``` even with json mode on."""
-    router = OpenAICompatibleRouter(
-        base_url="https://api.example.com/v1",
-        api_key="k",
-        model="m",
-    )
+    router = _make_router()
 
     fenced = (
         "```json\n"
@@ -434,7 +341,7 @@ async def test_router_strips_markdown_code_fences(monkeypatch):
     )
 
     def _fake_post(_payload):
-        return {"choices": [{"message": {"content": fenced}}]}
+        return _completion(fenced)
 
     monkeypatch.setattr(router, "_post_json", _fake_post)
     out = await router.route("hi")
@@ -448,24 +355,12 @@ async def test_router_defaults_to_json_response_format(monkeypatch):
     """JSON mode is on by default — DeepSeek and OpenAI-compatible APIs
     accept ``response_format: {"type":"json_object"}`` and emit far less
     prose wrapping when it is set."""
-    router = OpenAICompatibleRouter(
-        base_url="https://api.example.com/v1",
-        api_key="k",
-        model="m",
-    )
+    router = _make_router()
     captured: dict = {}
 
     def _spy_post(payload):
         captured["payload"] = payload
-        return {
-            "choices": [
-                {
-                    "message": {
-                        "content": '{"decision":"chat_reply","confidence":0.9,"goal":"","risk_hints":[]}'
-                    }
-                }
-            ]
-        }
+        return _CHAT_REPLY_COMPLETION
 
     monkeypatch.setattr(router, "_post_json", _spy_post)
     await router.route("hi")
@@ -477,25 +372,12 @@ async def test_router_extra_body_can_override_response_format(monkeypatch):
     """Operators on endpoints that reject ``json_object`` (or want a custom
     schema) must be able to override via ``extra_body`` — ``response_format``
     is intentionally NOT in the reserved-key list."""
-    router = OpenAICompatibleRouter(
-        base_url="https://api.example.com/v1",
-        api_key="k",
-        model="m",
-        extra_body={"response_format": {"type": "text"}},
-    )
+    router = _make_router(extra_body={"response_format": {"type": "text"}})
     captured: dict = {}
 
     def _spy_post(payload):
         captured["payload"] = payload
-        return {
-            "choices": [
-                {
-                    "message": {
-                        "content": '{"decision":"chat_reply","confidence":0.9,"goal":"","risk_hints":[]}'
-                    }
-                }
-            ]
-        }
+        return _CHAT_REPLY_COMPLETION
 
     monkeypatch.setattr(router, "_post_json", _spy_post)
     await router.route("hi")
@@ -505,25 +387,12 @@ async def test_router_extra_body_can_override_response_format(monkeypatch):
 @pytest.mark.asyncio
 async def test_router_max_tokens_constructor_param_propagates(monkeypatch):
     """Operators can dial up the budget for very chatty reasoning models."""
-    router = OpenAICompatibleRouter(
-        base_url="https://api.example.com/v1",
-        api_key="k",
-        model="m",
-        max_tokens=4096,
-    )
+    router = _make_router(max_tokens=4096)
     captured: dict = {}
 
     def _spy_post(payload):
         captured["payload"] = payload
-        return {
-            "choices": [
-                {
-                    "message": {
-                        "content": '{"decision":"chat_reply","confidence":0.9,"goal":"","risk_hints":[]}'
-                    }
-                }
-            ]
-        }
+        return _CHAT_REPLY_COMPLETION
 
     monkeypatch.setattr(router, "_post_json", _spy_post)
     await router.route("hi")
@@ -23,6 +23,7 @@ import pytest
 from oh_my_agent.gateway.manager import GatewayManager
 from oh_my_agent.gateway.router import RouteDecision, normalize_intent
 from oh_my_agent.runtime.policy import strip_draft_prefix
+from tests.conftest import noop_typing
 
 # ── Normalization matrix ──────────────────────────────────────────────── #
 
@@ -274,9 +275,7 @@ def _make_channel():
     channel.channel_id = "100"
     channel.create_thread = AsyncMock(return_value="t1")
     channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
+    channel.typing = noop_typing
     return channel
 
 
@@ -7,6 +7,33 @@ import pytest
 from oh_my_agent.config import load_config
 from oh_my_agent.gateway.router import OpenAICompatibleRouter
 
+_ROUTER_DECISION = {
+    "decision": "propose_repo_change",
+    "confidence": 0.92,
+    "goal": "create docs smoke file and run tests",
+    "risk_hints": ["multi_step", "run_tests"],
+    "skill_name": "",
+    "task_type": "repo_change",
+    "completion_mode": "merge",
+}
+
+# Encoded once; the fake transport hands back the same bytes on every call.
+_ROUTER_RESPONSE_BODY = json.dumps(
+    {
+        "id": "chatcmpl-local",
+        "object": "chat.completion",
+        "choices": [
+            {
+                "index": 0,
+                "message": {
+                    "role": "assistant",
+                    "content": json.dumps(_ROUTER_DECISION, ensure_ascii=False),
+                },
+            }
+        ],
+    }
+).encode("utf-8")
+
 
 class _FakeHTTPResponse:
     def __init__(self, body: bytes):
@@ -32,24 +59,7 @@ async def test_router_real_http_with_config_and_env(tmp_path, monkeypatch):
         seen["auth"] = req.get_header("Authorization")
         seen["timeout"] = timeout
         seen["payload"] = json.loads(req.data.decode("utf-8"))
-        content = json.dumps(
-            {
-                "decision": "propose_repo_change",
-                "confidence": 0.92,
-                "goal": "create docs smoke file and run tests",
-                "risk_hints": ["multi_step", "run_tests"],
-                "skill_name": "",
-                "task_type": "repo_change",
-                "completion_mode": "merge",
-            },
-            ensure_ascii=False,
-        )
-        body = {
-            "id": "chatcmpl-local",
-            "object": "chat.completion",
-            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}}],
-        }
-        return _FakeHTTPResponse(json.dumps(body).encode("utf-8"))
+        return _FakeHTTPResponse(_ROUTER_RESPONSE_BODY)
 
     monkeypatch.setattr(urllib.request, "urlopen", _fake_urlopen)
     cfg_path = tmp_path / "config.yaml"
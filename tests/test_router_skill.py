@@ -8,6 +8,7 @@ from oh_my_agent.gateway.base import IncomingMessage
 from oh_my_agent.gateway.manager import GatewayManager
 from oh_my_agent.gateway.router import RouteDecision
 from oh_my_agent.gateway.session import ChannelSession
+from tests.conftest import noop_typing
 
 
 def _make_msg(content: str, *, thread_id: str = "thread-1") -> IncomingMessage:
@@ -27,9 +28,7 @@ def _make_session_and_registry():
     channel.channel_id = "100"
     channel.create_thread = AsyncMock(return_value="thread-1")
     channel.send = AsyncMock()
-    channel.typing = MagicMock()
-    channel.typing.return_value.__aenter__ = AsyncMock(return_value=None)
-    channel.typing.return_value.__aexit__ = AsyncMock(return_value=False)
+    channel.typing = noop_typing
 
     agent = MagicMock()
     agent.name = "claude"
@@ -46,18 +45,41 @@ def _make_session_and_registry():
     return session, registry, channel
 
 
+class _StubRuntime:
+    """Runtime service stub that records which entry points the manager awaits."""
+
+    def __init__(self, *, handles_thread_context: bool = False):
+        self._handles_thread_context = handles_thread_context
+        self.calls: list[str] = []
+
+    async def maybe_handle_thread_context(self, *_args, **_kwargs) -> bool:
+        self.calls.append("maybe_handle_thread_context")
+        return self._handles_thread_context
+
+    async def create_skill_task(self, *_args, **_kwargs) -> None:
+        self.calls.append("create_skill_task")
+
+    async def create_task(self, *_args, **_kwargs) -> None:
+        self.calls.append("create_task")
+
+    async def maybe_handle_incoming(self, *_args, **_kwargs) -> bool:
+        self.calls.append("maybe_handle_incoming")
+        return False
+
+
+def _make_router(decision: RouteDecision | None) -> MagicMock:
+    router = MagicMock()
+    router.confidence_threshold = 0.55
+    router.route = AsyncMock(return_value=decision)
+    return router
+
+
 @pytest.mark.asyncio
 async def test_manager_routes_create_skill_from_router():
     session, registry, channel = _make_session_and_registry()
-    runtime_service = MagicMock()
-    runtime_service.maybe_handle_thread_context = AsyncMock(return_value=False)
-    runtime_service.create_skill_task = AsyncMock()
-    runtime_service.create_task = AsyncMock()
-    runtime_service.maybe_handle_incoming = AsyncMock(return_value=False)
-    router = MagicMock()
-    router.confidence_threshold = 0.55
-    router.route = AsyncMock(
-        return_value=RouteDecision(
+    runtime_service = _StubRuntime()
+    router = _make_router(
+        RouteDecision(
             # Canonical intent — the dispatcher decides create-vs-repair
             # by checking ``skill_name`` against registered skills. Here
             # ``weather`` is not registered (no skill_syncer in this test
@@ -74,9 +96,7 @@ async def test_manager_routes_create_skill_from_router():
 
     await gm.handle_message(session, registry, _make_msg("create a skill for weather"))
 
-    runtime_service.create_skill_task.assert_awaited_once()
-    runtime_service.create_task.assert_not_called()
-    runtime_service.maybe_handle_incoming.assert_not_called()
+    assert runtime_service.calls == ["maybe_handle_thread_context", "create_skill_task"]
     registry.run.assert_not_called()
     assert channel.send.await_count >= 1
     history = await session.get_history("thread-1")
@@ -87,15 +107,9 @@ async def test_manager_routes_create_skill_from_router():
 @pytest.mark.asyncio
 async def test_manager_high_confidence_reply_once_skips_skill_heuristic():
     session, registry, channel = _make_session_and_registry()
-    runtime_service = MagicMock()
-    runtime_service.maybe_handle_thread_context = AsyncMock(return_value=False)
-    runtime_service.create_skill_task = AsyncMock()
-    runtime_service.create_task = AsyncMock()
-    runtime_service.maybe_handle_incoming = AsyncMock(return_value=False)
-    router = MagicMock()
-    router.confidence_threshold = 0.55
-    router.route = AsyncMock(
-        return_value=RouteDecision(
+    runtime_service = _StubRuntime()
+    router = _make_router(
+        RouteDecision(
             decision="chat_reply",
             confidence=0.95,
             goal="",
@@ -107,8 +121,7 @@ async def test_manager_high_confidence_reply_once_skips_skill_heuristic():
 
     await gm.handle_message(session, registry, _make_msg("create a skill for weather"))
 
-    runtime_service.create_skill_task.assert_not_called()
-    runtime_service.maybe_handle_incoming.assert_not_called()
+    assert runtime_service.calls == ["maybe_handle_thread_context"]
     registry.run.assert_called_once()
     assert channel.send.await_count >= 1
 
@@ -116,15 +129,9 @@ async def test_manager_high_confidence_reply_once_skips_skill_heuristic():
 @pytest.mark.asyncio
 async def test_manager_low_confidence_reply_once_falls_back_to_skill_heuristic():
     session, registry, _ = _make_session_and_registry()
-    runtime_service = MagicMock()
-    runtime_service.maybe_handle_thread_context = AsyncMock(return_value=False)
-    runtime_service.create_skill_task = AsyncMock()
-    runtime_service.create_task = AsyncMock()
-    runtime_service.maybe_handle_incoming = AsyncMock(return_value=False)
-    router = MagicMock()
-    router.confidence_threshold = 0.55
-    router.route = AsyncMock(
-        return_value=RouteDecision(
+    runtime_service = _StubRuntime()
+    router = _make_router(
+        RouteDecision(
             decision="chat_reply",
             confidence=0.2,
             goal="",
@@ -136,29 +143,19 @@ async def test_manager_low_confidence_reply_once_falls_back_to_skill_heuristic()
 
     await gm.handle_message(session, registry, _make_msg("create a skill for weather"))
 
-    runtime_service.create_skill_task.assert_awaited_once()
-    runtime_service.maybe_handle_incoming.assert_not_called()
+    assert runtime_service.calls == ["maybe_handle_thread_context", "create_skill_task"]
 
 
 @pytest.mark.asyncio
 async def test_manager_thread_context_takes_priority_over_router():
     session, registry, channel = _make_session_and_registry()
-    runtime_service = MagicMock()
-    runtime_service.maybe_handle_thread_context = AsyncMock(return_value=True)
-    runtime_service.create_skill_task = AsyncMock()
-    runtime_service.create_task = AsyncMock()
-    runtime_service.maybe_handle_incoming = AsyncMock(return_value=False)
-    router = MagicMock()
-    router.confidence_threshold = 0.55
-    router.route = AsyncMock()
+    runtime_service = _StubRuntime(handles_thread_context=True)
+    router = _make_router(None)
     gm = GatewayManager([], runtime_service=runtime_service, intent_router=router, owner_user_ids={"owner-1"})
 
     await gm.handle_message(session, registry, _make_msg("retry merge"))
 
-    runtime_service.maybe_handle_thread_context.assert_awaited_once()
+    assert runtime_service.calls == ["maybe_handle_thread_context"]
     router.route.assert_not_called()
-    runtime_service.create_skill_task.assert_not_called()
-    runtime_service.create_task.assert_not_called()
-    runtime_service.maybe_handle_incoming.assert_not_called()
     registry.run.assert_not_called()
     channel.send.assert_not_called()
@@ -22,6 +22,7 @@ from pathlib import Path
 from unittest.mock import AsyncMock
 
 import pytest
+import pytest_asyncio
 
 from oh_my_agent.memory.store import SQLiteMemoryStore
 from oh_my_agent.runtime import (
@@ -70,7 +71,7 @@ def _pr_mode_cfg(tmp_path: Path) -> dict:
     }
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def pr_runtime(tmp_path: Path):
     repo = tmp_path / "repo"
     _init_git_repo(repo)
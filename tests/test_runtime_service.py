@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import os
+import shutil
 import subprocess
 import time
 from dataclasses import dataclass, field
@@ -10,6 +11,7 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 
 from oh_my_agent.agents.base import AgentResponse, BaseAgent
 from oh_my_agent.agents.registry import AgentRegistry
@@ -31,6 +33,7 @@ from oh_my_agent.runtime import (
     TASK_STATUS_WAITING_USER_INPUT,
     RuntimeService,
 )
+from tests.conftest import StatusNotifyingStore, wait_for_merge_gate, wait_for_status
 
 
 @dataclass
@@ -46,9 +49,16 @@ class _FakeChannel:
     signals: list[tuple[str, str | None, str]] = field(default_factory=list)
     attachments: list[tuple[str, str, Path, str | None]] = field(default_factory=list)
     hitl_prompts: list[dict] = field(default_factory=list)
+    # Notified on every send/draft so waiters wake instead of polling.
+    changed: asyncio.Condition = field(default_factory=asyncio.Condition)
+
+    async def _notify_changed(self) -> None:
+        async with self.changed:
+            self.changed.notify_all()
 
     async def send(self, thread_id: str, text: str) -> str:
         self.sent.append((thread_id, text))
+        await self._notify_changed()
         msg_id = f"m-{self._next_msg_id}"
         self._next_msg_id += 1
         return msg_id
@@ -97,6 +107,7 @@ class _FakeChannel:
                 "actions": actions,
             }
         )
+        await self._notify_changed()
         msg_id = f"d-{self._next_msg_id}"
         self._next_msg_id += 1
         return msg_id
@@ -570,82 +581,100 @@ class _SandboxBlockedAgent(BaseAgent):
         )
 
 
-def _init_git_repo(root: Path) -> None:
-    root.mkdir(parents=True, exist_ok=True)
-    (root / "README.md").write_text("# runtime test\n", encoding="utf-8")
-    (root / "src").mkdir(exist_ok=True)
-    (root / "src" / "__init__.py").write_text("", encoding="utf-8")
-    subprocess.run(["git", "init"], cwd=root, check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=root, check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.name", "Runtime Test"], cwd=root, check=True, capture_output=True)
-    subprocess.run(["git", "add", "."], cwd=root, check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "init"], cwd=root, check=True, capture_output=True)
+async def _wait_for_channel(channel: _FakeChannel, predicate, timeout: float) -> bool:
+    async with channel.changed:
+        try:
+            await asyncio.wait_for(channel.changed.wait_for(predicate), timeout)
+        except TimeoutError:
+            return False
+    return True
 
 
-async def _wait_for_status(store: SQLiteMemoryStore, task_id: str, expected: set[str], timeout: float = 8.0):
-    deadline = asyncio.get_running_loop().time() + timeout
-    while asyncio.get_running_loop().time() < deadline:
-        task = await store.get_runtime_task(task_id)
-        if task and task.status in expected:
-            return task
-        await asyncio.sleep(0.2)
-    task = await store.get_runtime_task(task_id)
-    raise AssertionError(f"Task {task_id} did not reach {expected}, got {task.status if task else 'missing'}")
+async def _wait_for_draft_count(channel: _FakeChannel, count: int, timeout: float = 8.0) -> None:
+    if not await _wait_for_channel(channel, lambda: len(channel.drafts) >= count, timeout):
+        raise AssertionError(f"Expected at least {count} draft message(s), got {len(channel.drafts)}")
 
 
-async def _wait_for_draft_count(channel: _FakeChannel, count: int, timeout: float = 8.0) -> None:
-    deadline = asyncio.get_running_loop().time() + timeout
-    while asyncio.get_running_loop().time() < deadline:
-        if len(channel.drafts) >= count:
-            return
-        await asyncio.sleep(0.1)
-    raise AssertionError(f"Expected at least {count} draft message(s), got {len(channel.drafts)}")
+async def _wait_for_sent_text(channel: _FakeChannel, needle: str, timeout: float = 8.0) -> None:
+    if not await _wait_for_channel(
+        channel, lambda: any(needle in text for _, text in channel.sent), timeout
+    ):
+        raise AssertionError(f"Expected a sent message containing {needle!r}")
+
+
+def _register_session(runtime: RuntimeService, channel: _FakeChannel, agent) -> tuple[ChannelSession, AgentRegistry]:
+    """Build the discord ``100`` session around a single agent and register it with *runtime*."""
+    registry = AgentRegistry([agent])
+    session = ChannelSession(
+        platform="discord",
+        channel_id="100",
+        channel=channel,
+        registry=registry,
+    )
+    runtime.register_session(session, registry)
+    return session, registry
+
+
+def _owner_msg(thread_id: str, content: str) -> IncomingMessage:
+    return IncomingMessage(
+        platform="discord",
+        channel_id="100",
+        thread_id=thread_id,
+        author="owner",
+        author_id="owner-1",
+        content=content,
+    )
+
+
+# runtime_env config minus the per-test paths; RuntimeService only reads it.
+_RUNTIME_ENV_CFG = {
+    "enabled": True,
+    "worker_concurrency": 1,
+    "default_agent": "done-agent",
+    "default_test_command": "true",
+    "default_max_steps": 8,
+    "default_max_minutes": 20,
+    "risk_profile": "strict",
+    "path_policy_mode": "allow_all_with_denylist",
+    "allowed_paths": ["src/**", "tests/**", "docs/**", "skills/**", "pyproject.toml"],
+    "denied_paths": ["config.yaml", ".env", ".workspace/**", ".git/**"],
+    "decision_ttl_minutes": 60,
+    "agent_heartbeat_seconds": 0.1,
+    "test_heartbeat_seconds": 0.1,
+    "test_timeout_seconds": 0.6,
+    "progress_notice_seconds": 0.1,
+    "progress_persist_seconds": 0.1,
+    "log_event_limit": 20,
+    "log_tail_chars": 400,
+    "cleanup": {
+        "enabled": False,
+        "interval_minutes": 60,
+        "retention_hours": 0,
+        "prune_git_worktrees": True,
+    },
+    "merge_gate": {
+        "enabled": True,
+        "auto_commit": True,
+        "require_clean_repo": True,
+        "preflight_check": True,
+        "target_branch_mode": "current",
+        "commit_message_template": "runtime(task:{task_id}): {goal_short}",
+    },
+}
 
 
-@pytest.fixture
-async def runtime_env(tmp_path):
+@pytest_asyncio.fixture
+async def runtime_env(tmp_path, git_template):
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
 
-    db_path = tmp_path / "runtime.db"
-    store = SQLiteMemoryStore(db_path)
+    store = StatusNotifyingStore(":memory:")
     await store.init()
 
     cfg = {
-        "enabled": True,
-        "worker_concurrency": 1,
+        **_RUNTIME_ENV_CFG,
         "worktree_root": str(tmp_path / "worktrees"),
         "reports_dir": str(tmp_path / "reports"),
-        "default_agent": "done-agent",
-        "default_test_command": "true",
-        "default_max_steps": 8,
-        "default_max_minutes": 20,
-        "risk_profile": "strict",
-        "path_policy_mode": "allow_all_with_denylist",
-        "allowed_paths": ["src/**", "tests/**", "docs/**", "skills/**", "pyproject.toml"],
-        "denied_paths": ["config.yaml", ".env", ".workspace/**", ".git/**"],
-        "decision_ttl_minutes": 60,
-        "agent_heartbeat_seconds": 0.1,
-        "test_heartbeat_seconds": 0.1,
-        "test_timeout_seconds": 0.6,
-        "progress_notice_seconds": 0.1,
-        "progress_persist_seconds": 0.1,
-        "log_event_limit": 20,
-        "log_tail_chars": 400,
-        "cleanup": {
-            "enabled": False,
-            "interval_minutes": 60,
-            "retention_hours": 0,
-            "prune_git_worktrees": True,
-        },
-        "merge_gate": {
-            "enabled": True,
-            "auto_commit": True,
-            "require_clean_repo": True,
-            "preflight_check": True,
-            "target_branch_mode": "current",
-            "commit_message_template": "runtime(task:{task_id}): {goal_short}",
-        },
     }
     runtime = RuntimeService(store, config=cfg, owner_user_ids={"owner-1"}, repo_root=repo)
     channel = _FakeChannel()
@@ -668,24 +697,10 @@ async def test_runtime_message_intent_draft_to_merge(runtime_env):
     channel: _FakeChannel = runtime_env["channel"]
     repo: Path = runtime_env["repo"]
 
-    registry = AgentRegistry([_DoneAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _DoneAgent())
     await runtime.start()
 
-    msg = IncomingMessage(
-        platform="discord",
-        channel_id="100",
-        thread_id="thread-1",
-        author="owner",
-        author_id="owner-1",
-        content="please fix and pip install missing deps then run tests",
-    )
+    msg = _owner_msg("thread-1", "please fix and pip install missing deps then run tests")
     handled = await runtime.maybe_handle_incoming(session, registry, msg, thread_id="thread-1")
     assert handled is True
     assert len(channel.drafts) == 1
@@ -720,7 +735,7 @@ async def test_runtime_message_intent_draft_to_merge(runtime_env):
         limit=10,
     ) == []
 
-    waiting = await _wait_for_status(store, tasks[0].id, {TASK_STATUS_WAITING_MERGE})
+    waiting = await wait_for_merge_gate(store, tasks[0].id)
     assert waiting.status == TASK_STATUS_WAITING_MERGE
     merge_notifications = await store.list_active_notification_events(
         dedupe_key=f"task:{tasks[0].id}:waiting_merge",
@@ -752,7 +767,7 @@ async def test_runtime_message_intent_draft_to_merge(runtime_env):
         limit=10,
     ) == []
 
-    merged = await _wait_for_status(store, tasks[0].id, {TASK_STATUS_MERGED})
+    merged = await wait_for_status(store, tasks[0].id, {TASK_STATUS_MERGED})
     assert merged.status == TASK_STATUS_MERGED
     assert merged.merge_commit_hash
     assert merged.workspace_path is None
@@ -766,14 +781,7 @@ async def test_runtime_blocked_then_resume(runtime_env):
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
     agent = _BlockedOnceAgent()
-    registry = AgentRegistry([agent])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, agent)
     await runtime.start()
 
     task = await runtime.create_task(
@@ -784,13 +792,13 @@ async def test_runtime_blocked_then_resume(runtime_env):
         created_by="owner-1",
         source="slash",
     )
-    blocked = await _wait_for_status(store, task.id, {TASK_STATUS_BLOCKED})
+    blocked = await wait_for_status(store, task.id, {TASK_STATUS_BLOCKED})
     assert blocked.status == TASK_STATUS_BLOCKED
 
     resume = await runtime.resume_task(task.id, "fixture is available now", actor_id="owner-1")
     assert "resumed" in resume.lower()
 
-    waiting = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE})
+    waiting = await wait_for_merge_gate(store, task.id)
     assert waiting.status == TASK_STATUS_WAITING_MERGE
     assert agent.calls >= 2
 
@@ -800,14 +808,7 @@ async def test_runtime_path_guard_marks_failed(runtime_env):
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_DeniedPathAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _DeniedPathAgent())
     await runtime.start()
 
     task = await runtime.create_task(
@@ -818,7 +819,7 @@ async def test_runtime_path_guard_marks_failed(runtime_env):
         created_by="owner-1",
         source="slash",
     )
-    failed = await _wait_for_status(store, task.id, {TASK_STATUS_FAILED})
+    failed = await wait_for_status(store, task.id, {TASK_STATUS_FAILED})
     assert failed.status == TASK_STATUS_FAILED
     assert "forbidden path" in (failed.error or "").lower()
 
@@ -828,14 +829,7 @@ async def test_runtime_allow_all_policy_permits_repo_root_changes(runtime_env):
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_RootReadmeAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _RootReadmeAgent())
     await runtime.start()
 
     task = await runtime.create_task(
@@ -846,7 +840,7 @@ async def test_runtime_allow_all_policy_permits_repo_root_changes(runtime_env):
         created_by="owner-1",
         source="slash",
     )
-    waiting = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE})
+    waiting = await wait_for_merge_gate(store, task.id)
     assert waiting.status == TASK_STATUS_WAITING_MERGE
 
 
@@ -855,14 +849,7 @@ async def test_runtime_manual_cleanup_removes_workspace(runtime_env):
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_DoneAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _DoneAgent())
     await runtime.start()
 
     task = await runtime.create_task(
@@ -873,7 +860,7 @@ async def test_runtime_manual_cleanup_removes_workspace(runtime_env):
         created_by="owner-1",
         source="slash",
     )
-    waiting = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE})
+    waiting = await wait_for_merge_gate(store, task.id)
     assert waiting.workspace_path
     ws = Path(waiting.workspace_path)
     assert ws.exists()
@@ -897,14 +884,7 @@ async def test_artifact_task_completes_without_merge(runtime_env):
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_ArtifactAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _ArtifactAgent())
     await runtime.start()
 
     task = await runtime.create_artifact_task(
@@ -915,7 +895,7 @@ async def test_artifact_task_completes_without_merge(runtime_env):
         created_by="owner-1",
         source="router",
     )
-    completed = await _wait_for_status(store, task.id, {TASK_STATUS_COMPLETED})
+    completed = await wait_for_status(store, task.id, {TASK_STATUS_COMPLETED})
     assert completed.status == TASK_STATUS_COMPLETED
     assert completed.completion_mode == "reply"
     assert completed.task_type == "artifact"
@@ -966,14 +946,7 @@ async def test_notify_failure_marks_failed_without_false_complete(runtime_env):
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_ArtifactAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _ArtifactAgent())
     await runtime.start()
 
     # Wrap ``_notify`` so only the terminal call (the one guarded by the
@@ -1000,7 +973,7 @@ async def test_notify_failure_marks_failed_without_false_complete(runtime_env):
         source="router",
     )
 
-    failed = await _wait_for_status(store, task.id, {TASK_STATUS_FAILED})
+    failed = await wait_for_status(store, task.id, {TASK_STATUS_FAILED})
 
     # Invariant 1: status is FAILED, not COMPLETED.
     assert failed.status == TASK_STATUS_FAILED
@@ -1042,14 +1015,7 @@ async def test_publish_canonical_destination_overwrites_without_suffix(runtime_e
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_ArtifactAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _ArtifactAgent())
     await runtime.start()
 
     for thread_suffix in ("a", "b"):
@@ -1061,7 +1027,7 @@ async def test_publish_canonical_destination_overwrites_without_suffix(runtime_e
             created_by="owner-1",
             source="router",
         )
-        await _wait_for_status(store, task.id, {TASK_STATUS_COMPLETED})
+        await wait_for_status(store, task.id, {TASK_STATUS_COMPLETED})
 
     reports_dir = runtime._reports_dir  # noqa: SLF001
     assert reports_dir is not None
@@ -1208,14 +1174,7 @@ async def test_publish_rule_4_end_to_end_via_task_flow(runtime_env, tmp_path):
     channel: _FakeChannel = runtime_env["channel"]
     reports_dir = runtime._reports_dir  # noqa: SLF001
     assert reports_dir is not None
-    registry = AgentRegistry([_DoneAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _DoneAgent())
 
     # Absolute file under neither workspace nor reports_dir.
     orphan_dir = tmp_path / "orphan-rule4"
@@ -1310,14 +1269,7 @@ async def test_artifact_task_delivery_falls_back_to_paths_when_attachments_not_a
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_ArtifactAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _ArtifactAgent())
     runtime._artifact_attachment_max_bytes = 1  # noqa: SLF001
     await runtime.start()
 
@@ -1329,7 +1281,7 @@ async def test_artifact_task_delivery_falls_back_to_paths_when_attachments_not_a
         created_by="owner-1",
         source="router",
     )
-    completed = await _wait_for_status(store, task.id, {TASK_STATUS_COMPLETED})
+    completed = await wait_for_status(store, task.id, {TASK_STATUS_COMPLETED})
     assert completed.status == TASK_STATUS_COMPLETED
     assert channel.attachments == []
     sent_texts = [text for _, text in channel.sent]
@@ -1389,14 +1341,7 @@ async def test_enqueue_scheduler_task_uses_reply_artifact_shape(runtime_env):
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
     store: SQLiteMemoryStore = runtime_env["store"]
-    registry = AgentRegistry([_ArtifactAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _ArtifactAgent())
 
     task = await runtime.enqueue_scheduler_task(
         session=session,
@@ -1423,14 +1368,7 @@ async def test_enqueue_scheduler_task_uses_automation_execution_overrides(runtim
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
     store: SQLiteMemoryStore = runtime_env["store"]
-    registry = AgentRegistry([_ArtifactAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _ArtifactAgent())
 
     task = await runtime.enqueue_scheduler_task(
         session=session,
@@ -1456,14 +1394,7 @@ async def test_enqueue_scheduler_task_skips_when_same_automation_is_inflight(run
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
     store: SQLiteMemoryStore = runtime_env["store"]
-    registry = AgentRegistry([_ArtifactAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _ArtifactAgent())
 
     first = await runtime.enqueue_scheduler_task(
         session=session,
@@ -1498,14 +1429,7 @@ async def test_enqueue_scheduler_task_reminds_when_blocked_by_draft(runtime_env)
     runtime: RuntimeService = runtime_env["runtime"]
     store: SQLiteMemoryStore = runtime_env["store"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_ArtifactAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _ArtifactAgent())
 
     first = await runtime.enqueue_scheduler_task(
         session=session,
@@ -1543,14 +1467,7 @@ async def test_enqueue_scheduler_task_does_not_remind_for_non_draft_block(runtim
     runtime: RuntimeService = runtime_env["runtime"]
     store: SQLiteMemoryStore = runtime_env["store"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_ArtifactAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _ArtifactAgent())
 
     first = await runtime.enqueue_scheduler_task(
         session=session,
@@ -1583,14 +1500,7 @@ async def test_replace_draft_task_discards_and_returns_automation_name(runtime_e
     runtime: RuntimeService = runtime_env["runtime"]
     store: SQLiteMemoryStore = runtime_env["store"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_ArtifactAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _ArtifactAgent())
 
     task = await runtime.enqueue_scheduler_task(
         session=session,
@@ -1618,14 +1528,7 @@ async def test_replace_draft_task_rejects_non_draft_status(runtime_env):
     runtime: RuntimeService = runtime_env["runtime"]
     store: SQLiteMemoryStore = runtime_env["store"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_ArtifactAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _ArtifactAgent())
 
     task = await runtime.enqueue_scheduler_task(
         session=session,
@@ -1649,14 +1552,7 @@ async def test_replace_draft_task_requires_authorization(runtime_env):
     runtime: RuntimeService = runtime_env["runtime"]
     store: SQLiteMemoryStore = runtime_env["store"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_ArtifactAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _ArtifactAgent())
 
     task = await runtime.enqueue_scheduler_task(
         session=session,
@@ -1680,14 +1576,7 @@ async def test_scheduler_automation_posts_direct_result_without_status_spam(runt
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_ArtifactAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _ArtifactAgent())
     await runtime.start()
 
     task = await runtime.enqueue_scheduler_task(
@@ -1701,7 +1590,7 @@ async def test_scheduler_automation_posts_direct_result_without_status_spam(runt
     )
     assert task is not None
 
-    completed = await _wait_for_status(store, task.id, {TASK_STATUS_COMPLETED})
+    completed = await wait_for_status(store, task.id, {TASK_STATUS_COMPLETED})
     assert completed.status == TASK_STATUS_COMPLETED
     assert completed.artifact_manifest == ["reports/daily-news.md"]
     assert channel.status_messages == {}
@@ -1725,14 +1614,7 @@ async def test_scheduler_automation_formats_body_notes_and_done_footer(runtime_e
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_AutomationNarrativeAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _AutomationNarrativeAgent())
     await runtime.start()
 
     task = await runtime.enqueue_scheduler_task(
@@ -1746,7 +1628,7 @@ async def test_scheduler_automation_formats_body_notes_and_done_footer(runtime_e
     )
     assert task is not None
 
-    completed = await _wait_for_status(store, task.id, {TASK_STATUS_COMPLETED})
+    completed = await wait_for_status(store, task.id, {TASK_STATUS_COMPLETED})
     assert completed.status == TASK_STATUS_COMPLETED
     sent_texts = [text for _, text in channel.sent]
     assert any("**Output**" in text for text in sent_texts)
@@ -1784,14 +1666,7 @@ async def test_scheduler_automation_failure_includes_usage_audit(runtime_env):
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_AutomationFailureAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _AutomationFailureAgent())
     await runtime.start()
 
     task = await runtime.enqueue_scheduler_task(
@@ -1805,8 +1680,9 @@ async def test_scheduler_automation_failure_includes_usage_audit(runtime_env):
     )
     assert task is not None
 
-    failed = await _wait_for_status(store, task.id, {TASK_STATUS_FAILED})
+    failed = await wait_for_status(store, task.id, {TASK_STATUS_FAILED})
     assert failed.status == TASK_STATUS_FAILED
+    await _wait_for_sent_text(channel, "$0.0456")
     sent_texts = [text for _, text in channel.sent]
     assert any(f"automation `daily-failure` · run `{task.id}` · via **automation-failure**" in text for text in sent_texts)
     assert any("321 in / 123 out" in text for text in sent_texts)
@@ -1819,14 +1695,7 @@ async def test_runtime_legacy_applied_is_mergeable(runtime_env):
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_DoneAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _DoneAgent())
     await runtime.start()
 
     task = await runtime.create_task(
@@ -1837,14 +1706,14 @@ async def test_runtime_legacy_applied_is_mergeable(runtime_env):
         created_by="owner-1",
         source="slash",
     )
-    waiting = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE})
+    waiting = await wait_for_merge_gate(store, task.id)
     assert waiting.workspace_path
 
     await store.update_runtime_task(task.id, status="APPLIED")
     result = await runtime.merge_task(task.id, actor_id="owner-1")
     assert "merged successfully" in result.lower()
 
-    merged = await _wait_for_status(store, task.id, {TASK_STATUS_MERGED})
+    merged = await wait_for_status(store, task.id, {TASK_STATUS_MERGED})
     assert merged.status == TASK_STATUS_MERGED
     assert merged.workspace_path is None
     assert merged.workspace_cleaned_at is not None
@@ -1875,7 +1744,7 @@ async def test_runtime_merge_sends_terminal_notification_and_records_history(run
         created_by="owner-1",
         source="slash",
     )
-    waiting = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE})
+    waiting = await wait_for_merge_gate(store, task.id)
     assert waiting.status == TASK_STATUS_WAITING_MERGE
 
     result = await runtime.merge_task(task.id, actor_id="owner-1")
@@ -1897,14 +1766,7 @@ async def test_runtime_merge_blocked_can_wait_and_retry_from_thread(runtime_env)
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
     repo: Path = runtime_env["repo"]
-    registry = AgentRegistry([_DoneAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _DoneAgent())
     await runtime.start()
 
     task = await runtime.create_task(
@@ -1915,7 +1777,7 @@ async def test_runtime_merge_blocked_can_wait_and_retry_from_thread(runtime_env)
         created_by="owner-1",
         source="slash",
     )
-    waiting = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE})
+    waiting = await wait_for_merge_gate(store, task.id)
     assert waiting.status == TASK_STATUS_WAITING_MERGE
 
     (repo / "README.md").write_text("# dirty\n", encoding="utf-8")
@@ -1928,14 +1790,7 @@ async def test_runtime_merge_blocked_can_wait_and_retry_from_thread(runtime_env)
     assert blocked_merge.merge_error
     assert any(draft["task_id"] == task.id for draft in channel.drafts[1:])
 
-    wait_msg = IncomingMessage(
-        platform="discord",
-        channel_id="100",
-        thread_id="thread-merge-retry",
-        author="owner",
-        author_id="owner-1",
-        content="wait",
-    )
+    wait_msg = _owner_msg("thread-merge-retry", "wait")
     handled_wait = await runtime.maybe_handle_thread_context(session, wait_msg, thread_id="thread-merge-retry")
     assert handled_wait is True
     waiting_again = await store.get_runtime_task(task.id)
@@ -1945,18 +1800,11 @@ async def test_runtime_merge_blocked_can_wait_and_retry_from_thread(runtime_env)
     subprocess.run(["git", "add", "README.md"], cwd=repo, check=True, capture_output=True)
     subprocess.run(["git", "commit", "-m", "clean repo for retry"], cwd=repo, check=True, capture_output=True)
 
-    retry_msg = IncomingMessage(
-        platform="discord",
-        channel_id="100",
-        thread_id="thread-merge-retry",
-        author="owner",
-        author_id="owner-1",
-        content="retry merge",
-    )
+    retry_msg = _owner_msg("thread-merge-retry", "retry merge")
     handled_retry = await runtime.maybe_handle_thread_context(session, retry_msg, thread_id="thread-merge-retry")
     assert handled_retry is True
 
-    merged = await _wait_for_status(store, task.id, {TASK_STATUS_MERGED})
+    merged = await wait_for_status(store, task.id, {TASK_STATUS_MERGED})
     assert merged.status == TASK_STATUS_MERGED
     assert merged.merge_commit_hash
 
@@ -1966,14 +1814,11 @@ async def test_runtime_logs_capture_heartbeats_and_tails(runtime_env):
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_SlowDoneAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _SlowDoneAgent())
+    # The fixture's 0.6s test timeout exists for the timeout test; this
+    # command only needs to outlive a few heartbeats, and a Python start-up
+    # under parallel workers can eat most of 0.6s on its own.
+    runtime._test_timeout_seconds = 5.0  # noqa: SLF001
     await runtime.start()
 
     task = await runtime.create_task(
@@ -1985,7 +1830,7 @@ async def test_runtime_logs_capture_heartbeats_and_tails(runtime_env):
         test_command="python -c \"import time; print('test-start'); time.sleep(0.25); print('test-end')\"",
         source="slash",
     )
-    waiting = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE})
+    waiting = await wait_for_merge_gate(store, task.id)
     assert waiting.status == TASK_STATUS_WAITING_MERGE
 
     text = await runtime.get_task_logs(task.id)
@@ -2001,14 +1846,7 @@ async def test_runtime_logs_include_live_agent_log_tail(runtime_env):
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_DoneAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _DoneAgent())
     await runtime.start()
 
     task = await runtime.create_task(
@@ -2019,7 +1857,7 @@ async def test_runtime_logs_include_live_agent_log_tail(runtime_env):
         created_by="owner-1",
         source="slash",
     )
-    waiting = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE})
+    waiting = await wait_for_merge_gate(store, task.id)
     assert waiting.status == TASK_STATUS_WAITING_MERGE
 
     await store.update_runtime_task(task.id, status=TASK_STATUS_RUNNING, ended_at=None)
@@ -2039,14 +1877,7 @@ async def test_runtime_logs_include_thread_excerpt_after_completion(runtime_env)
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_DoneAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _DoneAgent())
     await runtime.start()
 
     task = await runtime.create_task(
@@ -2057,7 +1888,7 @@ async def test_runtime_logs_include_thread_excerpt_after_completion(runtime_env)
         created_by="owner-1",
         source="slash",
     )
-    waiting = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE})
+    waiting = await wait_for_merge_gate(store, task.id)
     assert waiting.status == TASK_STATUS_WAITING_MERGE
 
     logs = await runtime.get_task_logs(task.id)
@@ -2075,14 +1906,7 @@ async def test_runtime_test_timeout_marks_timeout(runtime_env):
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_DoneAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _DoneAgent())
     await runtime.start()
 
     task = await runtime.create_task(
@@ -2094,7 +1918,7 @@ async def test_runtime_test_timeout_marks_timeout(runtime_env):
         test_command="python -c \"import time; print('before-timeout'); time.sleep(1.0)\"",
         source="slash",
     )
-    timed_out = await _wait_for_status(store, task.id, {TASK_STATUS_TIMEOUT}, timeout=5.0)
+    timed_out = await wait_for_status(store, task.id, {TASK_STATUS_TIMEOUT}, timeout=5.0)
     assert timed_out.status == TASK_STATUS_TIMEOUT
     assert "timed out" in (timed_out.summary or "").lower() or "timed out" in (timed_out.error or "").lower()
     text = await runtime.get_task_logs(task.id)
@@ -2106,14 +1930,7 @@ async def test_runtime_router_raw_request_preserved_and_visible_in_prompt(runtim
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_DoneAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _DoneAgent())
     await runtime.start()
 
     task = await runtime.create_task(
@@ -2125,7 +1942,7 @@ async def test_runtime_router_raw_request_preserved_and_visible_in_prompt(runtim
         created_by="owner-1",
         source="router",
     )
-    waiting = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE})
+    waiting = await wait_for_merge_gate(store, task.id)
     assert waiting.status == TASK_STATUS_WAITING_MERGE
 
     loaded = await store.get_runtime_task(task.id)
@@ -2142,14 +1959,7 @@ async def test_runtime_overrides_agent_block_when_runtime_tests_pass(runtime_env
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_SandboxBlockedAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _SandboxBlockedAgent())
     await runtime.start()
 
     task = await runtime.create_task(
@@ -2162,7 +1972,7 @@ async def test_runtime_overrides_agent_block_when_runtime_tests_pass(runtime_env
         test_command="true",
         source="slash",
     )
-    waiting = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE})
+    waiting = await wait_for_merge_gate(store, task.id)
     assert waiting.status == TASK_STATUS_WAITING_MERGE
 
     logs = await runtime.get_task_logs(task.id)
@@ -2181,9 +1991,9 @@ async def test_runtime_formats_pytest_output_summary(runtime_env):
 
 
 @pytest.mark.asyncio
-async def test_runtime_start_cleans_stale_merged_workspace(tmp_path):
+async def test_runtime_start_cleans_stale_merged_workspace(tmp_path, git_template):
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
 
     db_path = tmp_path / "runtime.db"
     store = SQLiteMemoryStore(db_path)
@@ -2245,9 +2055,9 @@ async def test_runtime_start_cleans_stale_merged_workspace(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_runtime_start_prunes_stale_agent_logs(tmp_path, caplog):
+async def test_runtime_start_prunes_stale_agent_logs(tmp_path, git_template, caplog):
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
     worktree_root = tmp_path / "worktrees"
     store = SQLiteMemoryStore(tmp_path / "cleanup-logs.db")
     await store.init()
@@ -2296,6 +2106,7 @@ class _StoppableSlowAgent(BaseAgent):
 
     def __init__(self, sleep_seconds: float = 5.0) -> None:
         self._sleep = sleep_seconds
+        self.started = asyncio.Event()
 
     @property
     def name(self) -> str:
@@ -2311,6 +2122,7 @@ class _StoppableSlowAgent(BaseAgent):
     ) -> AgentResponse:
         del prompt, history, thread_id
         assert workspace_override is not None
+        self.started.set()
         await asyncio.sleep(self._sleep)
         out = workspace_override / "src" / "slow.txt"
         out.parent.mkdir(parents=True, exist_ok=True)
@@ -2347,14 +2159,8 @@ async def test_runtime_stop_while_running_interrupts_agent(runtime_env):
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
 
-    registry = AgentRegistry([_StoppableSlowAgent(sleep_seconds=5.0)])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    agent = _StoppableSlowAgent(sleep_seconds=5.0)
+    session, registry = _register_session(runtime, channel, agent)
     await runtime.start()
 
     task = await runtime.create_task(
@@ -2366,12 +2172,12 @@ async def test_runtime_stop_while_running_interrupts_agent(runtime_env):
         source="slash",
     )
 
-    # Wait for task to start running, then stop it
-    await asyncio.sleep(0.3)
+    # Wait for the agent to start running, then stop it
+    await asyncio.wait_for(agent.started.wait(), timeout=3.0)
     stop_result = await runtime.stop_task(task.id, actor_id="owner-1")
     assert "stopped" in stop_result.lower()
 
-    stopped = await _wait_for_status(store, task.id, {TASK_STATUS_STOPPED}, timeout=3.0)
+    stopped = await wait_for_status(store, task.id, {TASK_STATUS_STOPPED}, timeout=3.0)
     assert stopped.status == TASK_STATUS_STOPPED
 
 
@@ -2382,14 +2188,8 @@ async def test_runtime_message_stop_while_running(runtime_env):
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
 
-    registry = AgentRegistry([_StoppableSlowAgent(sleep_seconds=5.0)])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    agent = _StoppableSlowAgent(sleep_seconds=5.0)
+    session, registry = _register_session(runtime, channel, agent)
     await runtime.start()
 
     task = await runtime.create_task(
@@ -2401,22 +2201,15 @@ async def test_runtime_message_stop_while_running(runtime_env):
         source="slash",
     )
 
-    # Wait for it to reach running state
-    await asyncio.sleep(0.3)
+    # Wait for the agent to start running
+    await asyncio.wait_for(agent.started.wait(), timeout=3.0)
 
     # Send "stop" as a message in the same thread
-    stop_msg = IncomingMessage(
-        platform="discord",
-        channel_id="100",
-        thread_id="thread-msg-stop",
-        author="owner",
-        author_id="owner-1",
-        content="stop",
-    )
+    stop_msg = _owner_msg("thread-msg-stop", "stop")
     handled = await runtime.maybe_handle_incoming(session, registry, stop_msg, thread_id="thread-msg-stop")
     assert handled is True
 
-    stopped = await _wait_for_status(store, task.id, {TASK_STATUS_STOPPED}, timeout=4.0)
+    stopped = await wait_for_status(store, task.id, {TASK_STATUS_STOPPED}, timeout=4.0)
     assert stopped.status == TASK_STATUS_STOPPED
 
 
@@ -2428,14 +2221,8 @@ async def test_runtime_pause_and_resume(runtime_env):
     channel: _FakeChannel = runtime_env["channel"]
 
     # Use a short-sleep stoppable agent so we can intercept it
-    registry = AgentRegistry([_StoppableSlowAgent(sleep_seconds=3.0)])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    agent = _StoppableSlowAgent(sleep_seconds=0.5)
+    session, registry = _register_session(runtime, channel, agent)
     await runtime.start()
 
     task = await runtime.create_task(
@@ -2447,12 +2234,12 @@ async def test_runtime_pause_and_resume(runtime_env):
         source="slash",
     )
 
-    # Wait briefly then pause
-    await asyncio.sleep(0.3)
+    # Wait for the agent to start running, then pause
+    await asyncio.wait_for(agent.started.wait(), timeout=3.0)
     pause_result = await runtime.pause_task(task.id, actor_id="owner-1")
     assert "paused" in pause_result.lower()
 
-    paused = await _wait_for_status(store, task.id, {TASK_STATUS_PAUSED}, timeout=3.0)
+    paused = await wait_for_status(store, task.id, {TASK_STATUS_PAUSED}, timeout=3.0)
     assert paused.status == TASK_STATUS_PAUSED
 
     # Now swap in a fast agent and resume
@@ -2463,7 +2250,7 @@ async def test_runtime_pause_and_resume(runtime_env):
     assert "resumed" in resume_result.lower()
 
     # Task should reach WAITING_MERGE now with the fast agent
-    done = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE}, timeout=8.0)
+    done = await wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE}, timeout=8.0)
     assert done.status == TASK_STATUS_WAITING_MERGE
 
 
@@ -2475,14 +2262,7 @@ async def test_runtime_blocked_thread_message_auto_resumes(runtime_env):
     channel: _FakeChannel = runtime_env["channel"]
 
     agent = _BlockedOnceAgent()
-    registry = AgentRegistry([agent])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, agent)
     await runtime.start()
 
     task = await runtime.create_task(
@@ -2493,22 +2273,15 @@ async def test_runtime_blocked_thread_message_auto_resumes(runtime_env):
         created_by="owner-1",
         source="slash",
     )
-    blocked = await _wait_for_status(store, task.id, {TASK_STATUS_BLOCKED})
+    blocked = await wait_for_status(store, task.id, {TASK_STATUS_BLOCKED})
     assert blocked.status == TASK_STATUS_BLOCKED
 
     # Send a plain message (not a control word, not a long task intent)
-    reply = IncomingMessage(
-        platform="discord",
-        channel_id="100",
-        thread_id="thread-auto-resume",
-        author="owner",
-        author_id="owner-1",
-        content="the fixture is now available in conftest.py",
-    )
+    reply = _owner_msg("thread-auto-resume", "the fixture is now available in conftest.py")
     handled = await runtime.maybe_handle_incoming(session, registry, reply, thread_id="thread-auto-resume")
     assert handled is True
 
-    waiting = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE}, timeout=8.0)
+    waiting = await wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE}, timeout=8.0)
     assert waiting.status == TASK_STATUS_WAITING_MERGE
 
 
@@ -2519,14 +2292,7 @@ async def test_runtime_completion_summary_has_files_and_timing(runtime_env):
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
 
-    registry = AgentRegistry([_DoneAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _DoneAgent())
     await runtime.start()
 
     task = await runtime.create_task(
@@ -2537,7 +2303,7 @@ async def test_runtime_completion_summary_has_files_and_timing(runtime_env):
         created_by="owner-1",
         source="slash",
     )
-    waiting = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE})
+    waiting = await wait_for_merge_gate(store, task.id)
     assert waiting.status == TASK_STATUS_WAITING_MERGE
 
     loaded = await store.get_runtime_task(task.id)
@@ -2548,8 +2314,7 @@ async def test_runtime_completion_summary_has_files_and_timing(runtime_env):
     assert "Timing:" in summary
 
     # Check task.completed event has latency fields
-    events = await store.list_runtime_events(task.id, limit=50)
-    completed = [e for e in events if e.get("event_type") == "task.completed"]
+    completed = await store.list_runtime_events(task.id, limit=1, event_type="task.completed")
     assert completed, "Expected task.completed event"
     payload = completed[-1].get("payload", {})
     assert "total_agent_s" in payload
@@ -2564,24 +2329,10 @@ async def test_runtime_suggest_action_resends_decision_surface(runtime_env):
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
 
-    registry = AgentRegistry([_DoneAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _DoneAgent())
     await runtime.start()
 
-    msg = IncomingMessage(
-        platform="discord",
-        channel_id="100",
-        thread_id="thread-suggest",
-        author="owner",
-        author_id="owner-1",
-        content="please fix and pip install missing deps then run tests",
-    )
+    msg = _owner_msg("thread-suggest", "please fix and pip install missing deps then run tests")
     await runtime.maybe_handle_incoming(session, registry, msg, thread_id="thread-suggest")
 
     tasks = await store.list_runtime_tasks(platform="discord", channel_id="100")
@@ -2619,14 +2370,7 @@ async def test_suggest_handler_writes_budget_overrides(runtime_env):
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_DoneAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _DoneAgent())
     await runtime.start()
 
     draft = await store.create_runtime_task(
@@ -2666,8 +2410,7 @@ async def test_suggest_handler_writes_budget_overrides(runtime_env):
     assert updated.agent_timeout_seconds == 1200
     assert updated.resume_instruction == "please narrow to README only"
 
-    events = await store.list_runtime_events("task-sb")
-    suggested = [e for e in events if e["event_type"] == "task.suggested"]
+    suggested = await store.list_runtime_events("task-sb", event_type="task.suggested")
     assert suggested, "task.suggested event should be recorded"
     payload = suggested[-1]["payload"]
     assert payload["max_turns_override"] == 50
@@ -2691,14 +2434,7 @@ async def test_suggest_handler_without_budget_leaves_fields(runtime_env):
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_DoneAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _DoneAgent())
     await runtime.start()
 
     await store.create_runtime_task(
@@ -2763,14 +2499,7 @@ async def test_decide_suggest_promoted_to_request_changes_applies_budget(runtime
     store: SQLiteMemoryStore = runtime_env["store"]
     runtime: RuntimeService = runtime_env["runtime"]
     channel: _FakeChannel = runtime_env["channel"]
-    registry = AgentRegistry([_DoneAgent()])
-    session = ChannelSession(
-        platform="discord",
-        channel_id="100",
-        channel=channel,
-        registry=registry,
-    )
-    runtime.register_session(session, registry)
+    session, registry = _register_session(runtime, channel, _DoneAgent())
     await runtime.start()
 
     # Pre-seed a repo_change task at WAITING_MERGE with baseline budgets.
@@ -2997,9 +2726,9 @@ def test_artifact_reply_text_renders_full_output_summary_as_body(runtime_env):
 
 
 @pytest.mark.asyncio
-async def test_start_auth_login_sends_qr_prompt(tmp_path):
+async def test_start_auth_login_sends_qr_prompt(tmp_path, git_template):
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
     store = SQLiteMemoryStore(tmp_path / "auth-runtime.db")
     await store.init()
     auth = _FakeAuthService()
@@ -3041,9 +2770,9 @@ async def test_start_auth_login_sends_qr_prompt(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_mark_task_auth_required_waits_then_resumes(tmp_path):
+async def test_mark_task_auth_required_waits_then_resumes(tmp_path, git_template):
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
     store = SQLiteMemoryStore(tmp_path / "auth-runtime.db")
     await store.init()
     auth = _FakeAuthService()
@@ -3116,9 +2845,9 @@ async def test_mark_task_auth_required_waits_then_resumes(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_mark_thread_auth_required_waits_then_resumes(tmp_path):
+async def test_mark_thread_auth_required_waits_then_resumes(tmp_path, git_template):
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
     store = SQLiteMemoryStore(tmp_path / "auth-thread.db")
     await store.init()
     auth = _FakeAuthService()
@@ -3208,9 +2937,9 @@ async def test_mark_thread_auth_required_waits_then_resumes(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_mark_thread_ask_user_waits_then_resumes(tmp_path):
+async def test_mark_thread_ask_user_waits_then_resumes(tmp_path, git_template):
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
     store = SQLiteMemoryStore(tmp_path / "hitl-thread.db")
     await store.init()
     runtime = RuntimeService(
@@ -3306,9 +3035,9 @@ async def test_mark_thread_ask_user_waits_then_resumes(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_thread_hitl_nested_prompt_keeps_structured_answer_payload(tmp_path):
+async def test_thread_hitl_nested_prompt_keeps_structured_answer_payload(tmp_path, git_template):
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
     store = SQLiteMemoryStore(tmp_path / "hitl-thread-nested.db")
     await store.init()
     runtime = RuntimeService(
@@ -3380,9 +3109,9 @@ async def test_thread_hitl_nested_prompt_keeps_structured_answer_payload(tmp_pat
 
 
 @pytest.mark.asyncio
-async def test_thread_hitl_resume_logs_progress_and_honors_skill_timeout_override(tmp_path, caplog):
+async def test_thread_hitl_resume_logs_progress_and_honors_skill_timeout_override(tmp_path, git_template, caplog):
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
     skills_path = tmp_path / "skills"
     skill_dir = skills_path / "market-briefing-ai"
     skill_dir.mkdir(parents=True)
@@ -3474,9 +3203,9 @@ metadata:
 
 
 @pytest.mark.asyncio
-async def test_mark_task_ask_user_waits_and_answer_requeues_task(tmp_path):
+async def test_mark_task_ask_user_waits_and_answer_requeues_task(tmp_path, git_template):
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
     store = SQLiteMemoryStore(tmp_path / "hitl-task.db")
     await store.init()
     runtime = RuntimeService(
@@ -3558,8 +3287,7 @@ async def test_mark_task_ask_user_waits_and_answer_requeues_task(tmp_path):
     assert prompt_after is not None
     assert prompt_after.status == "completed"
     assert prompt_after.resume_context["last_hitl_answer"]["choice_id"] == "ai"
-    events = await store.list_runtime_events(task.id, limit=10)
-    answered = [event for event in events if event["event_type"] == "task.ask_user_answered"]
+    answered = await store.list_runtime_events(task.id, event_type="task.ask_user_answered")
     assert answered
     assert answered[-1]["payload"]["choice_id"] == "ai"
     assert answered[-1]["payload"]["target_kind"] == "task"
@@ -3573,9 +3301,9 @@ async def test_mark_task_ask_user_waits_and_answer_requeues_task(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_cancel_task_hitl_prompt_blocks_task(tmp_path):
+async def test_cancel_task_hitl_prompt_blocks_task(tmp_path, git_template):
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
     store = SQLiteMemoryStore(tmp_path / "hitl-task-cancel.db")
     await store.init()
     runtime = RuntimeService(
@@ -3689,13 +3417,13 @@ def _make_artifact_task(task_id: str = "task-link-1"):
 
 
 @pytest.mark.asyncio
-async def test_prepare_task_workspace_links_agent_workspace_dirs(tmp_path):
+async def test_prepare_task_workspace_links_agent_workspace_dirs(tmp_path, git_template):
     """`_artifacts/<task_id>/` is bare by design; without these symlinks the
     CLI agent burns turns probing for SKILL.md / .venv from a cwd that has
     neither. Verify symlinks resolve `./.venv/bin/python` and Claude's
     parent-walk skill discovery for free."""
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
 
     agent_ws = tmp_path / "agent-workspace"
     venv_dir = agent_ws / ".venv" / "bin"
@@ -3738,13 +3466,13 @@ async def test_prepare_task_workspace_links_agent_workspace_dirs(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_prepare_task_workspace_links_workspace_hint_files(tmp_path):
+async def test_prepare_task_workspace_links_workspace_hint_files(tmp_path, git_template):
     """Once ``_setup_workspace`` deposits AGENTS.md / CLAUDE.md / GEMINI.md
     in the agent workspace, ``_prepare_task_workspace`` symlinks them into
     the task cwd so the agent reads its own per-agent hint file at start-up
     (Claude reads CLAUDE.md, Gemini reads GEMINI.md, codex reads AGENTS.md)."""
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
 
     agent_ws = tmp_path / "agent-workspace"
     agent_ws.mkdir(parents=True)
@@ -3776,11 +3504,11 @@ async def test_prepare_task_workspace_links_workspace_hint_files(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_prepare_task_workspace_no_agent_workspace_skips_linking(tmp_path):
+async def test_prepare_task_workspace_no_agent_workspace_skips_linking(tmp_path, git_template):
     """Backward-compat: without agent_workspace configured, the artifact dir
     is still bare (legacy behavior)."""
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
     store = SQLiteMemoryStore(tmp_path / "runtime.db")
     await store.init()
     runtime = RuntimeService(
@@ -4030,11 +3758,11 @@ def test_retention_resolver_back_compat_without_by_outcome(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_cleanup_logs_back_compat_without_by_outcome(tmp_path):
+async def test_cleanup_logs_back_compat_without_by_outcome(tmp_path, git_template):
     """Without retention_hours_by_outcome, status-aware cleanup must
     behave exactly like the legacy flat retention path."""
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
     store = SQLiteMemoryStore(tmp_path / "back-compat.db")
     await store.init()
 
@@ -4091,9 +3819,9 @@ async def test_cleanup_logs_back_compat_without_by_outcome(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_cleanup_logs_status_aware_per_file(tmp_path):
+async def test_cleanup_logs_status_aware_per_file(tmp_path, git_template):
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
     store = SQLiteMemoryStore(tmp_path / "log-buckets.db")
     await store.init()
 
@@ -4533,12 +4261,12 @@ async def test_automation_ask_user_progress_writes_diary_only_with_author(runtim
 
 
 @pytest.mark.asyncio
-async def test_cleanup_tasks_uses_per_outcome_retention(tmp_path):
+async def test_cleanup_tasks_uses_per_outcome_retention(tmp_path, git_template):
     """Failure tasks aged 200h survive (336h budget); aged 400h get cleaned.
     Success tasks aged 100h get cleaned (72h budget); aged 50h survive.
     """
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
     store = SQLiteMemoryStore(tmp_path / "task-buckets.db")
     await store.init()
 
@@ -4613,13 +4341,13 @@ async def test_cleanup_tasks_uses_per_outcome_retention(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_collect_provider_credential_hints_bilibili(tmp_path):
+async def test_collect_provider_credential_hints_bilibili(tmp_path, git_template):
     """A cached bilibili credential should surface a `--cookies-path` hint when
     the request text mentions a bilibili URL — without this, every new task /
     chat reply triggers a redundant QR auth flow even though valid cookies are
     already on disk."""
     repo = tmp_path / "repo"
-    _init_git_repo(repo)
+    shutil.copytree(git_template, repo)
     store = SQLiteMemoryStore(tmp_path / "cred-hints.db")
     await store.init()
     auth = _FakeAuthService()
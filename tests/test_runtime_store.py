@@ -1,7 +1,6 @@
 import pytest
 
 from oh_my_agent.auth.types import AUTH_SCOPE_DEFAULT
-from oh_my_agent.memory.store import SQLiteMemoryStore
 from oh_my_agent.runtime.types import (
     TASK_COMPLETION_MERGE,
     TASK_COMPLETION_REPLY,
@@ -14,17 +13,9 @@ from oh_my_agent.runtime.types import (
 )
 
 
-@pytest.fixture
-async def store(tmp_path):
-    s = SQLiteMemoryStore(tmp_path / "runtime.db")
-    await s.init()
-    yield s
-    await s.close()
-
-
 @pytest.mark.asyncio
-async def test_runtime_task_crud_and_listing(store):
-    created = await store.create_runtime_task(
+async def test_runtime_task_crud_and_listing(memory_store):
+    created = await memory_store.create_runtime_task(
         task_id="task-1",
         platform="discord",
         channel_id="100",
@@ -40,25 +31,25 @@ async def test_runtime_task_crud_and_listing(store):
     assert created.id == "task-1"
     assert created.status == TASK_STATUS_DRAFT
 
-    loaded = await store.get_runtime_task("task-1")
+    loaded = await memory_store.get_runtime_task("task-1")
     assert loaded is not None
     assert loaded.goal == "fix tests"
     assert loaded.task_type == TASK_TYPE_REPO_CHANGE
     assert loaded.completion_mode == TASK_COMPLETION_MERGE
 
-    tasks = await store.list_runtime_tasks(platform="discord", channel_id="100", limit=10)
+    tasks = await memory_store.list_runtime_tasks(platform="discord", channel_id="100", limit=10)
     assert len(tasks) == 1
     assert tasks[0].id == "task-1"
 
-    updated = await store.update_runtime_task("task-1", status=TASK_STATUS_PENDING, step_no=1)
+    updated = await memory_store.update_runtime_task("task-1", status=TASK_STATUS_PENDING, step_no=1)
     assert updated is not None
     assert updated.status == TASK_STATUS_PENDING
     assert updated.step_no == 1
 
 
 @pytest.mark.asyncio
-async def test_runtime_claim_requeue_and_checkpoint(store):
-    await store.create_runtime_task(
+async def test_runtime_claim_requeue_and_checkpoint(memory_store):
+    await memory_store.create_runtime_task(
         task_id="task-2",
         platform="discord",
         channel_id="100",
@@ -72,19 +63,19 @@ async def test_runtime_claim_requeue_and_checkpoint(store):
         test_command="pytest -q",
     )
 
-    claimed = await store.claim_pending_runtime_task()
+    claimed = await memory_store.claim_pending_runtime_task()
     assert claimed is not None
     assert claimed.id == "task-2"
     assert claimed.status == TASK_STATUS_RUNNING
 
-    changed = await store.requeue_inflight_runtime_tasks()
+    changed = await memory_store.requeue_inflight_runtime_tasks()
     assert changed >= 1
-    again = await store.get_runtime_task("task-2")
+    again = await memory_store.get_runtime_task("task-2")
     assert again is not None
     assert again.status == TASK_STATUS_PENDING
     assert again.step_no == 0
 
-    await store.add_runtime_checkpoint(
+    await memory_store.add_runtime_checkpoint(
         task_id="task-2",
         step_no=1,
         status=TASK_STATUS_RUNNING,
@@ -93,15 +84,32 @@ async def test_runtime_claim_requeue_and_checkpoint(store):
         test_result="failing test",
         files_changed=["src/app.py"],
     )
-    ckpt = await store.get_last_runtime_checkpoint("task-2")
+    ckpt = await memory_store.get_last_runtime_checkpoint("task-2")
     assert ckpt is not None
     assert ckpt["step_no"] == 1
     assert "failing test" in ckpt["test_result"]
 
 
 @pytest.mark.asyncio
-async def test_runtime_requeue_rolls_back_step_for_validating_task(store):
-    await store.create_runtime_task(
+async def test_runtime_events_filter_by_type(memory_store):
+    await memory_store.add_runtime_event("task-ev", "task.created", {"source": "slash"})
+    await memory_store.add_runtime_event("task-ev", "task.resumed", {"n": 1})
+    await memory_store.add_runtime_event("task-ev", "task.checkpoint", {"step": 1})
+    await memory_store.add_runtime_event("task-ev", "task.resumed", {"n": 2})
+
+    resumed = await memory_store.list_runtime_events("task-ev", event_type="task.resumed")
+    assert [e["payload"]["n"] for e in resumed] == [1, 2]
+
+    latest = await memory_store.list_runtime_events("task-ev", limit=1, event_type="task.resumed")
+    assert [e["payload"]["n"] for e in latest] == [2]
+
+    everything = await memory_store.list_runtime_events("task-ev")
+    assert [e["seq"] for e in everything] == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_runtime_requeue_rolls_back_step_for_validating_task(memory_store):
+    await memory_store.create_runtime_task(
         task_id="task-2b",
         platform="discord",
         channel_id="100",
@@ -114,19 +122,19 @@ async def test_runtime_requeue_rolls_back_step_for_validating_task(store):
         max_minutes=10,
         test_command="true",
     )
-    await store.update_runtime_task("task-2b", status="VALIDATING", step_no=1)
+    await memory_store.update_runtime_task("task-2b", status="VALIDATING", step_no=1)
 
-    changed = await store.requeue_inflight_runtime_tasks()
+    changed = await memory_store.requeue_inflight_runtime_tasks()
     assert changed >= 1
-    again = await store.get_runtime_task("task-2b")
+    again = await memory_store.get_runtime_task("task-2b")
     assert again is not None
     assert again.status == TASK_STATUS_PENDING
     assert again.step_no == 0
 
 
 @pytest.mark.asyncio
-async def test_runtime_decision_nonce_lifecycle(store):
-    await store.create_runtime_task(
+async def test_runtime_decision_nonce_lifecycle(memory_store):
+    await memory_store.create_runtime_task(
         task_id="task-3",
         platform="discord",
         channel_id="100",
@@ -140,12 +148,12 @@ async def test_runtime_decision_nonce_lifecycle(store):
         test_command="pytest -q",
     )
 
-    nonce = await store.create_runtime_decision_nonce("task-3", ttl_minutes=30)
+    nonce = await memory_store.create_runtime_decision_nonce("task-3", ttl_minutes=30)
     assert len(nonce) == 8
-    active = await store.get_active_runtime_decision_nonce("task-3")
+    active = await memory_store.get_active_runtime_decision_nonce("task-3")
     assert active == nonce
 
-    ok = await store.consume_runtime_decision_nonce(
+    ok = await memory_store.consume_runtime_decision_nonce(
         task_id="task-3",
         nonce=nonce,
         action="approve",
@@ -155,13 +163,13 @@ async def test_runtime_decision_nonce_lifecycle(store):
     )
     assert ok is True
 
-    active_after = await store.get_active_runtime_decision_nonce("task-3")
+    active_after = await memory_store.get_active_runtime_decision_nonce("task-3")
     assert active_after is None
 
 
 @pytest.mark.asyncio
-async def test_runtime_cleanup_candidate_filter(store):
-    await store.create_runtime_task(
+async def test_runtime_cleanup_candidate_filter(memory_store):
+    await memory_store.create_runtime_task(
         task_id="task-4",
         platform="discord",
         channel_id="100",
@@ -174,13 +182,13 @@ async def test_runtime_cleanup_candidate_filter(store):
         max_minutes=20,
         test_command="pytest -q",
     )
-    await store.update_runtime_task(
+    await memory_store.update_runtime_task(
         "task-4",
         workspace_path="/tmp/workspace-task-4",
         ended_at="2000-01-01 00:00:00",
     )
 
-    candidates = await store.list_runtime_cleanup_candidates(
+    candidates = await memory_store.list_runtime_cleanup_candidates(
         statuses=[TASK_STATUS_MERGED],
         older_than_hours=1,
         limit=10,
@@ -190,8 +198,8 @@ async def test_runtime_cleanup_candidate_filter(store):
 
 
 @pytest.mark.asyncio
-async def test_runtime_task_stores_artifact_fields(store):
-    created = await store.create_runtime_task(
+async def test_runtime_task_stores_artifact_fields(memory_store):
+    created = await memory_store.create_runtime_task(
         task_id="task-artifact",
         platform="discord",
         channel_id="100",
@@ -209,7 +217,7 @@ async def test_runtime_task_stores_artifact_fields(store):
         artifact_manifest=["report.md"],
     )
     assert created.task_type == TASK_TYPE_ARTIFACT
-    loaded = await store.get_runtime_task("task-artifact")
+    loaded = await memory_store.get_runtime_task("task-artifact")
     assert loaded is not None
     assert loaded.task_type == TASK_TYPE_ARTIFACT
     assert loaded.completion_mode == TASK_COMPLETION_REPLY
@@ -218,8 +226,8 @@ async def test_runtime_task_stores_artifact_fields(store):
 
 
 @pytest.mark.asyncio
-async def test_notification_event_crud_and_resolution(store):
-    created = await store.create_notification_event(
+async def test_notification_event_crud_and_resolution(memory_store):
+    created = await memory_store.create_notification_event(
         notification_id="notif-1",
         kind="ask_user",
         status="active",
@@ -238,21 +246,21 @@ async def test_notification_event_crud_and_resolution(store):
     assert created.id == "notif-1"
     assert created.payload["question"] == "Pick one"
 
-    active = await store.list_active_notification_events(
+    active = await memory_store.list_active_notification_events(
         dedupe_key="task:task-1:ask_user",
         limit=10,
     )
     assert len(active) == 1
     assert active[0].owner_user_id == "owner-1"
 
-    updated = await store.update_notification_event("notif-1", dm_message_id="dm-2")
+    updated = await memory_store.update_notification_event("notif-1", dm_message_id="dm-2")
     assert updated is not None
     assert updated.dm_message_id == "dm-2"
 
-    changed = await store.resolve_notification_events(dedupe_key="task:task-1:ask_user")
+    changed = await memory_store.resolve_notification_events(dedupe_key="task:task-1:ask_user")
     assert changed == 1
 
-    active_after = await store.list_active_notification_events(
+    active_after = await memory_store.list_active_notification_events(
         dedupe_key="task:task-1:ask_user",
         limit=10,
     )
@@ -260,8 +268,8 @@ async def test_notification_event_crud_and_resolution(store):
 
 
 @pytest.mark.asyncio
-async def test_auth_credential_and_flow_crud(store):
-    credential = await store.upsert_auth_credential(
+async def test_auth_credential_and_flow_crud(memory_store):
+    credential = await memory_store.upsert_auth_credential(
         credential_id="cred-1",
         provider="bilibili",
         owner_user_id="owner-1",
@@ -275,11 +283,11 @@ async def test_auth_credential_and_flow_crud(store):
     assert credential.provider == "bilibili"
     assert credential.metadata["mid"] == 123
 
-    loaded_credential = await store.get_auth_credential("bilibili", "owner-1")
+    loaded_credential = await memory_store.get_auth_credential("bilibili", "owner-1")
     assert loaded_credential is not None
     assert loaded_credential.storage_path == "/tmp/cookies.txt"
 
-    flow = await store.create_auth_flow(
+    flow = await memory_store.create_auth_flow(
         flow_id="flow-1",
         provider="bilibili",
         owner_user_id="owner-1",
@@ -295,21 +303,21 @@ async def test_auth_credential_and_flow_crud(store):
     )
     assert flow.linked_task_id == "task-1"
 
-    active = await store.get_active_auth_flow("bilibili", "owner-1")
+    active = await memory_store.get_active_auth_flow("bilibili", "owner-1")
     assert active is not None
     assert active.id == "flow-1"
 
-    updated = await store.update_auth_flow("flow-1", status="approved", completed_at_now=True)
+    updated = await memory_store.update_auth_flow("flow-1", status="approved", completed_at_now=True)
     assert updated is not None
     assert updated.status == "approved"
 
-    active_after = await store.get_active_auth_flow("bilibili", "owner-1")
+    active_after = await memory_store.get_active_auth_flow("bilibili", "owner-1")
     assert active_after is None
 
 
 @pytest.mark.asyncio
-async def test_get_task_statuses_returns_subset(store):
-    await store.create_runtime_task(
+async def test_get_task_statuses_returns_subset(memory_store):
+    await memory_store.create_runtime_task(
         task_id="t-success",
         platform="discord",
         channel_id="100",
@@ -322,7 +330,7 @@ async def test_get_task_statuses_returns_subset(store):
         max_minutes=20,
         test_command="pytest",
     )
-    await store.create_runtime_task(
+    await memory_store.create_runtime_task(
         task_id="t-running",
         platform="discord",
         channel_id="100",
@@ -336,12 +344,12 @@ async def test_get_task_statuses_returns_subset(store):
         test_command="pytest",
     )
 
-    assert await store.get_task_statuses([]) == {}
+    assert await memory_store.get_task_statuses([]) == {}
 
-    statuses = await store.get_task_statuses(["t-success", "t-running", "ghost"])
+    statuses = await memory_store.get_task_statuses(["t-success", "t-running", "ghost"])
     assert statuses == {
         "t-success": TASK_STATUS_DRAFT,
         "t-running": TASK_STATUS_RUNNING,
     }
 
-    assert await store.get_task_statuses(["ghost-1", "ghost-2"]) == {}
+    assert await memory_store.get_task_statuses(["ghost-1", "ghost-2"]) == {}
@@ -379,6 +379,23 @@ def test_build_scheduler_empty_dir_returns_live_scheduler(tmp_path):
     assert storage_dir.exists()
 
 
+def test_scan_snapshot_only_tracks_yaml_files(tmp_path):
+    storage_dir = tmp_path / "automations"
+    scheduler = Scheduler(storage_dir=storage_dir, reload_interval_seconds=5)
+    (storage_dir / "b.yml").write_text("name: b\n", encoding="utf-8")
+    (storage_dir / "a.yaml").write_text("name: a\n", encoding="utf-8")
+    (storage_dir / "notes.txt").write_text("ignored\n", encoding="utf-8")
+    (storage_dir / "dir.yaml").mkdir()
+    (storage_dir / "link.yaml").symlink_to(storage_dir / "a.yaml")
+
+    snapshot = scheduler._scan_snapshot()
+
+    resolved = storage_dir.resolve()
+    assert list(snapshot) == [resolved / "a.yaml", resolved / "b.yml"]
+    size = (storage_dir / "a.yaml").stat().st_size
+    assert snapshot[resolved / "a.yaml"][1] == size
+
+
 def test_cron_parser_accepts_standard_fields():
     spec = _parse_cron_expression("*/15 9-17 * * 1-5")
     assert 0 in spec.minute
@@ -410,7 +427,8 @@ async def test_scheduler_fires_interval_job(tmp_path):
             platform="discord",
             channel_id="123",
             prompt="run",
-            interval_seconds=60,
+            interval_seconds=3600,
+            initial_delay_seconds=0,
         )
     }
 
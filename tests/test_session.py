@@ -1,15 +1,19 @@
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
 
+# ChannelSession never calls into its channel or registry.
+_STUB = SimpleNamespace()
+
 
 def _make_session():
     from oh_my_agent.gateway.session import ChannelSession
     return ChannelSession(
         platform="discord",
         channel_id="123",
-        channel=MagicMock(),
-        registry=MagicMock(),
+        channel=_STUB,
+        registry=_STUB,
     )
 
 
@@ -91,8 +95,8 @@ async def test_diary_writer_receives_user_and_assistant_turns(tmp_path):
     s = ChannelSession(
         platform="discord",
         channel_id="c1",
-        channel=MagicMock(),
-        registry=MagicMock(),
+        channel=_STUB,
+        registry=_STUB,
         diary_writer=writer,
     )
     await s.append_user("t1", "hi", "alice")
@@ -117,8 +121,8 @@ async def test_diary_writer_failures_do_not_break_session(tmp_path):
     s = ChannelSession(
         platform="discord",
         channel_id="c1",
-        channel=MagicMock(),
-        registry=MagicMock(),
+        channel=_STUB,
+        registry=_STUB,
         diary_writer=_ExplodingDiary(),
     )
     # The append must succeed even though the diary raises.
@@ -145,8 +149,8 @@ async def test_append_diary_only_skips_memory_and_cache():
     s = ChannelSession(
         platform="discord",
         channel_id="100",
-        channel=MagicMock(),
-        registry=MagicMock(),
+        channel=_STUB,
+        registry=_STUB,
         memory_store=memory,
         diary_writer=diary,
     )
@@ -168,8 +172,8 @@ async def test_append_diary_only_default_role_is_system():
     s = ChannelSession(
         platform="discord",
         channel_id="100",
-        channel=MagicMock(),
-        registry=MagicMock(),
+        channel=_STUB,
+        registry=_STUB,
         diary_writer=diary,
     )
     await s.append_diary_only("t-1", "ping")
@@ -184,8 +188,8 @@ async def test_append_diary_only_passes_author_and_role():
     s = ChannelSession(
         platform="discord",
         channel_id="100",
-        channel=MagicMock(),
-        registry=MagicMock(),
+        channel=_STUB,
+        registry=_STUB,
         diary_writer=diary,
     )
     await s.append_diary_only("t-2", "agent text", role="assistant", author="claude")
@@ -201,8 +205,8 @@ async def test_append_diary_only_no_writer_is_noop():
     s = ChannelSession(
         platform="discord",
         channel_id="100",
-        channel=MagicMock(),
-        registry=MagicMock(),
+        channel=_STUB,
+        registry=_STUB,
         diary_writer=None,
     )
     # Should not raise.
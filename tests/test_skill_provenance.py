@@ -1,19 +1,9 @@
 import pytest
 
-from oh_my_agent.memory.store import SQLiteMemoryStore
-
-
-@pytest.fixture
-async def store(tmp_path):
-    s = SQLiteMemoryStore(tmp_path / "runtime.db")
-    await s.init()
-    yield s
-    await s.close()
-
 
 @pytest.mark.asyncio
-async def test_skill_provenance_merge_overrides_reverse_sync(store):
-    await store.upsert_skill_provenance(
+async def test_skill_provenance_merge_overrides_reverse_sync(memory_store):
+    await memory_store.upsert_skill_provenance(
         "weather",
         source_task_id=None,
         created_by="agent-side-effect",
@@ -25,7 +15,7 @@ async def test_skill_provenance_merge_overrides_reverse_sync(store):
         validated=0,
     )
 
-    await store.upsert_skill_provenance(
+    await memory_store.upsert_skill_provenance(
         "weather",
         source_task_id="task-1",
         created_by="owner-1",
@@ -39,7 +29,7 @@ async def test_skill_provenance_merge_overrides_reverse_sync(store):
         merged_commit_hash="abc123",
     )
 
-    row = await store.get_skill_provenance("weather")
+    row = await memory_store.get_skill_provenance("weather")
     assert row is not None
     assert row["source_task_id"] == "task-1"
     assert row["created_by"] == "owner-1"
@@ -51,8 +41,8 @@ async def test_skill_provenance_merge_overrides_reverse_sync(store):
 
 
 @pytest.mark.asyncio
-async def test_skill_provenance_reverse_sync_does_not_override_merged_facts(store):
-    await store.upsert_skill_provenance(
+async def test_skill_provenance_reverse_sync_does_not_override_merged_facts(memory_store):
+    await memory_store.upsert_skill_provenance(
         "weather",
         source_task_id="task-1",
         created_by="owner-1",
@@ -65,7 +55,7 @@ async def test_skill_provenance_reverse_sync_does_not_override_merged_facts(stor
         merged_commit_hash="abc123",
     )
 
-    await store.upsert_skill_provenance(
+    await memory_store.upsert_skill_provenance(
         "weather",
         source_task_id=None,
         created_by="agent-side-effect",
@@ -75,7 +65,7 @@ async def test_skill_provenance_reverse_sync_does_not_override_merged_facts(stor
         validation_warnings=["warn-2"],
     )
 
-    row = await store.get_skill_provenance("weather")
+    row = await memory_store.get_skill_provenance("weather")
     assert row is not None
     assert row["source_task_id"] == "task-1"
     assert row["created_by"] == "owner-1"
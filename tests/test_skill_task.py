@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import asyncio
-import subprocess
+import shutil
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 
 from oh_my_agent.agents.base import AgentResponse, BaseAgent
 from oh_my_agent.agents.registry import AgentRegistry
@@ -19,6 +19,7 @@ from oh_my_agent.runtime.types import (
     TASK_STATUS_WAITING_MERGE,
     TASK_TYPE_SKILL,
 )
+from tests.conftest import StatusNotifyingStore, wait_for_merge_gate, wait_for_status
 
 
 @dataclass
@@ -195,42 +196,12 @@ class _FakeSkillSyncer:
         return target
 
 
-def _init_repo(root: Path) -> None:
-    root.mkdir(parents=True, exist_ok=True)
-    (root / "README.md").write_text("# skill repo\n", encoding="utf-8")
-    quick_validate = root / "skills" / "skill-creator" / "scripts" / "quick_validate.py"
-    quick_validate.parent.mkdir(parents=True, exist_ok=True)
-    quick_validate.write_text(
-        "import sys\nfrom pathlib import Path\n"
-        "skill = Path(sys.argv[1])\n"
-        "skill_md = skill / 'SKILL.md'\n"
-        "sys.exit(0 if skill_md.exists() and skill_md.read_text(encoding='utf-8').startswith('---') else 1)\n",
-        encoding="utf-8",
-    )
-    subprocess.run(["git", "init"], cwd=root, check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=root, check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.name", "Skill Test"], cwd=root, check=True, capture_output=True)
-    subprocess.run(["git", "add", "."], cwd=root, check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "init"], cwd=root, check=True, capture_output=True)
-
-
-async def _wait_for_status(store: SQLiteMemoryStore, task_id: str, expected: set[str], timeout: float = 8.0):
-    deadline = asyncio.get_running_loop().time() + timeout
-    while asyncio.get_running_loop().time() < deadline:
-        task = await store.get_runtime_task(task_id)
-        if task and task.status in expected:
-            return task
-        await asyncio.sleep(0.2)
-    task = await store.get_runtime_task(task_id)
-    raise AssertionError(f"Task {task_id} did not reach {expected}, got {task.status if task else 'missing'}")
-
-
-@pytest.fixture
-async def skill_runtime_env(tmp_path):
+@pytest_asyncio.fixture
+async def skill_runtime_env(tmp_path, git_template):
     repo = tmp_path / "repo"
-    _init_repo(repo)
+    shutil.copytree(git_template, repo)
 
-    store = SQLiteMemoryStore(tmp_path / "runtime.db")
+    store = StatusNotifyingStore(":memory:")
     await store.init()
 
     syncer = _FakeSkillSyncer()
@@ -393,7 +364,7 @@ async def test_skill_task_merge_records_provenance(skill_runtime_env, tmp_path):
     assert approve_event is not None
     await runtime.handle_decision_event(approve_event)
 
-    waiting = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE})
+    waiting = await wait_for_merge_gate(store, task.id)
     assert waiting.status == TASK_STATUS_WAITING_MERGE
     assert waiting.skill_name == "weather"
 
@@ -409,7 +380,7 @@ async def test_skill_task_merge_records_provenance(skill_runtime_env, tmp_path):
     result = await runtime.handle_decision_event(merge_event)
     assert "reload-skills" in result.lower()
 
-    merged = await _wait_for_status(store, task.id, {TASK_STATUS_MERGED})
+    merged = await wait_for_status(store, task.id, {TASK_STATUS_MERGED})
     assert merged.status == TASK_STATUS_MERGED
     assert (repo / "skills" / "weather" / "SKILL.md").exists()
     assert syncer.calls == 1
@@ -458,7 +429,7 @@ async def test_skill_task_overlap_review_blocks_auto_merge(skill_runtime_env):
         source="router",
     )
 
-    waiting = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE})
+    waiting = await wait_for_merge_gate(store, task.id)
     assert waiting.status == TASK_STATUS_WAITING_MERGE
     assert waiting.merge_commit_hash is None
 
@@ -491,7 +462,7 @@ async def test_skill_task_source_grounded_missing_metadata_forces_review(skill_r
         source="router",
     )
 
-    waiting = await _wait_for_status(store, task.id, {TASK_STATUS_WAITING_MERGE})
+    waiting = await wait_for_merge_gate(store, task.id)
     assert waiting.status == TASK_STATUS_WAITING_MERGE
     assert waiting.merge_commit_hash is None
 
@@ -524,7 +495,7 @@ async def test_skill_task_source_grounded_pass_allows_auto_merge(skill_runtime_e
         source="router",
     )
 
-    merged = await _wait_for_status(store, task.id, {TASK_STATUS_MERGED})
+    merged = await wait_for_status(store, task.id, {TASK_STATUS_MERGED})
     assert merged.status == TASK_STATUS_MERGED
     assert (repo / "skills" / "bibigpt-v1-adapter" / "SKILL.md").exists()
 
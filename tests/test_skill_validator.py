@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import stat
+import warnings
 from pathlib import Path
 
 import pytest
@@ -184,6 +185,36 @@ class TestScriptChecks:
         assert result.valid  # warning only
         assert any("run.py" in w for w in result.warnings)
 
+    def test_python_compiler_warning_is_not_reported(self, validator, tmp_path):
+        skill_dir = _make_skill(
+            tmp_path,
+            scripts=[("run.py", 'import re\nassert (1, 2)\nre.compile("\\d")\n', True)],
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = validator.validate(skill_dir)
+        assert result.valid
+        assert result.warnings == []
+
+    def test_null_byte_in_python_is_syntax_warning(self, validator, tmp_path):
+        skill_dir = _make_skill(
+            tmp_path,
+            scripts=[("run.py", "x = 1\0\n", True)],
+        )
+        result = validator.validate(skill_dir)
+        assert result.valid
+        assert any("run.py" in w and "syntax error" in w for w in result.warnings)
+
+    def test_pathological_python_is_syntax_warning(self, validator, tmp_path):
+        # Deep enough to exhaust the compiler's recursion limit.
+        skill_dir = _make_skill(
+            tmp_path,
+            scripts=[("run.py", "x = 1" + " + 1" * 300000, True)],
+        )
+        result = validator.validate(skill_dir)
+        assert result.valid
+        assert any("run.py" in w and "syntax error" in w for w in result.warnings)
+
     def test_non_executable_script_is_warning(self, validator, tmp_path):
         skill_dir = _make_skill(
             tmp_path,
@@ -5,13 +5,14 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 
 import pytest
+import pytest_asyncio
 
 from oh_my_agent.agents.base import AgentResponse
 from oh_my_agent.memory.store import SQLiteMemoryStore
 from oh_my_agent.utils.usage import record_usage_from_response
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def store(tmp_path):
     s = SQLiteMemoryStore(tmp_path / "usage.db")
     await s.init()
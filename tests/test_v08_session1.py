@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import pytest
+import pytest_asyncio
 
 from oh_my_agent.config_validator import (
     ConfigError,
@@ -355,7 +356,7 @@ class TestConfigValidator:
 
 
 class TestSchemaVersion:
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def store(self, tmp_path):
         s = SQLiteMemoryStore(tmp_path / "test.db")
         await s.init()